@@ -7,6 +7,10 @@ PARAMS = {
     "Llncosh": dict(mu=0.01, lambd=0.1),
     "GMCC":    dict(mu=0.01, lambd=0.05, alpha=2.0),
     "GNGD":    dict(mu=0.01, eps=0.1, ro=1e-4),
+    "SAF-LMS": dict(mu=0.01, bands=16),
+    "SAF-NLMS":dict(mu=0.5,  eps=1e-3, bands=16),
+    "GAL":     dict(mu=0.02, mu_k=0.01, beta=0.99, eps=1e-3),
+    "LSL":     dict(mu=0.999, eps=1e-2),
 }
 
 LIMITS = {
@@ -18,6 +22,10 @@ LIMITS = {
     "Llncosh": {"mu": (1e-6, 0.5),   "lambd": (1e-9, 1.0)},
     "GMCC":    {"mu": (1e-6, 0.5),   "lambd": (1e-9, 1.0), "alpha": (0.5, 5.0)},
     "GNGD":    {"mu": (1e-6, 1.0),   "eps": (1e-9, 1.0), "ro": (1e-9, 1.0)},
+    "SAF-LMS": {"mu": (1e-6, 1.0),   "bands": (4, 128)},
+    "SAF-NLMS":{"mu": (1e-6, 1.999), "eps": (1e-9, 1.0), "bands": (4, 128)},
+    "GAL":     {"mu": (1e-6, 0.1),   "mu_k": (1e-6, 0.1), "beta": (0.9, 0.9999), "eps": (1e-9, 1.0)},
+    "LSL":     {"mu": (0.99, 1.0),   "eps": (1e-6, 10.0)},
 }
 
 PRESETS = {
@@ -63,4 +71,33 @@ PRESETS = {
         "Adaptive":  dict(mu=0.05, eps=0.05, ro=5e-4),
         "Robust":    dict(mu=0.008, eps=0.2, ro=1e-4),
     },
+    "SAF-LMS": {
+        "Default":   dict(mu=0.01, bands=16),
+        "Fine bands":dict(mu=0.005, bands=32),
+    },
+    "SAF-NLMS": {
+        "Default":   dict(mu=0.5, eps=1e-3, bands=16),
+        "Long echo": dict(mu=0.3, eps=1e-3, bands=32),
+        "Fast":      dict(mu=1.0, eps=1e-3, bands=8),
+    },
+    "GAL": {
+        "Default":   dict(mu=0.02, mu_k=0.01, beta=0.99, eps=1e-3),
+        "Fast":      dict(mu=0.05, mu_k=0.02, beta=0.98, eps=1e-3),
+        "Smooth":    dict(mu=0.01, mu_k=0.003, beta=0.999, eps=1e-3),
+    },
+    "LSL": {
+        "Default":   dict(mu=0.999, eps=1e-2),
+        "Tracking":  dict(mu=0.995, eps=1e-2),
+        "Stationary":dict(mu=0.9999, eps=1e-2),
+    },
+}
+
+# synthetic signal scenarios (see filters/scenarios.py); fs, f0, T, noise,
+# ANC mode and seed come from the main window
+SCENARIOS = {
+    "Chirp":               dict(signal="chirp", f1=500.0, sweep=1.0),
+    "Multi-tone":          dict(signal="multitone", tones=(100.0, 230.0, 370.0)),
+    "Impulsive noise":     dict(noise="impulsive", impulse_prob=1e-3, impulse_amp=20.0),
+    "Colored noise":       dict(noise="colored", color_cutoff=0.1),
+    "Time-varying plant":  dict(plant_len=256, plant_decay=0.02, plant_period=4.0),
 }
@@ -3,7 +3,23 @@ from .safety import (
     clamp_array, safe_square, safe_log10_of_square, is_diverged
 )
 
-from .signal_generation import make_signals, hist_input
-from .metrics import compute_metrics, moving_avg
+from .signal_generation import make_signals, make_inputs, hist_input
+from .metrics import compute_metrics, moving_avg, weight_misalignment_db
 from .fft_utils import fft_mag
-from .filter_runner import run_padasip_filter, enforce_runtime_stability
+from .filter_runner import (
+    make_filter, run_filter, run_padasip_filter, iter_filter_chunks, retune_filter,
+    enforce_runtime_stability, changed_params, MAX_TAPS, MAX_TAPS_SUBBAND, max_taps, check_taps
+)
+from .weight_history import WeightRecorder, WEIGHT_MODES
+from .subband import SUBBAND_ALGS, DFTFilterBank, SubbandFilter, run_subband_filter
+from .lattice import (LATTICE_ALGS, GradientLattice, LeastSquaresLattice, run_lattice_filter,
+                      lattice_order_sweep)
+from .scenarios import (
+    SCENARIO_DEFAULTS, scenario_spec, scenario_length,
+    generate_chunk, make_scenario, iter_scenario, iter_scenario_parallel
+)
+from .pyramid import SummaryPyramid, minmax_envelope
+from .export import FixedPoint, GoldenExporter, export_run, export_chunked
+from .comparison import run_comparison
+from .live import RingBuffer, LiveSession
+from .precompute import PresetPrecomputer
@@ -0,0 +1,93 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .filter_runner import run_padasip_filter
+from .subband import SUBBAND_ALGS, run_subband_filter
+from .lattice import LATTICE_ALGS, run_lattice_filter
+
+
+def _share(a):
+    a = np.ascontiguousarray(a, dtype=float)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, a.nbytes))
+    view = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)
+    view[...] = a
+    return shm, (shm.name, a.shape)
+
+
+def _attach(spec):
+    name, shape = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=float, buffer=shm.buf)
+
+
+def _compare_worker(row, name, params, d_spec, X_spec, out_spec):
+    segs = []
+    try:
+        for spec in (d_spec, X_spec, out_spec):
+            segs.append(_attach(spec))
+        d, X, out = (a for _, a in segs)
+        if name in SUBBAND_ALGS:
+            # the newest input sample of every regressor row is x aligned with d
+            y, e, _ = run_subband_filter(name, d, X[:, 0], X.shape[1], params)
+        elif name in LATTICE_ALGS:
+            y, e, _ = run_lattice_filter(name, d, X[:, 0], X.shape[1], params)
+        else:
+            y, e, _ = run_padasip_filter(name, d, X, params)
+        out[row, 0, :] = y
+        out[row, 1, :] = e
+        return None
+    except Exception as ex:
+        return str(ex)
+    finally:
+        # drop array views before closing the mappings
+        d = X = out = None
+        for shm, _ in segs:
+            shm.close()
+
+
+def run_comparison(d, X, alg_params, max_workers=None, executor=None):
+    """Run several algorithms on the same (d, X) concurrently.
+
+    `d` and `X` are copied once into shared memory; every worker maps them
+    read-only and writes its y/e into its own row of a shared output block.
+    Returns ``(results, errors)`` with ``results[alg] = (y, e)`` and
+    ``errors[alg] = message`` for algorithms that failed or diverged.
+    """
+    names = list(alg_params.keys())
+    M = len(d)
+
+    shm_d, d_spec = _share(d)
+    shm_X, X_spec = _share(X)
+    shm_out, out_spec = _share(np.zeros((len(names), 2, M)))
+
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(max_workers=max_workers or min(len(names), os.cpu_count() or 1))
+
+    try:
+        futs = [
+            executor.submit(_compare_worker, row, name, alg_params[name],
+                            d_spec, X_spec, out_spec)
+            for row, name in enumerate(names)
+        ]
+        errs = [f.result() for f in futs]
+
+        out = np.ndarray((len(names), 2, M), dtype=float, buffer=shm_out.buf)
+        results, errors = {}, {}
+        for row, (name, err) in enumerate(zip(names, errs)):
+            if err is None:
+                results[name] = (out[row, 0].copy(), out[row, 1].copy())
+            else:
+                errors[name] = err
+        out = None
+    finally:
+        if own:
+            executor.shutdown()
+        for shm in (shm_d, shm_X, shm_out):
+            shm.close()
+            shm.unlink()
+
+    return results, errors
+
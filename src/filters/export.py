@@ -0,0 +1,282 @@
+import hashlib
+import json
+import os
+import re
+import numpy as np
+
+EXPORT_FORMATS = ("bin", "hex", "mem")
+_HEX = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_BUF = 1 << 20
+_BLOCK = 1 << 18
+
+
+class FixedPoint:
+    """Two's-complement Qm.n format (m integer bits including the sign).
+
+    Values are scaled by 2**n, rounded to nearest and saturated to the
+    word range.
+    """
+
+    def __init__(self, int_bits=1, frac_bits=15, signed=True):
+        self.int_bits = int(int_bits)
+        self.frac_bits = int(frac_bits)
+        self.signed = bool(signed)
+        self.word_bits = self.int_bits + self.frac_bits
+        if not 1 <= self.word_bits <= 64:
+            raise ValueError("word length must be 1..64 bits")
+        if self.signed:
+            self.qmin = -(1 << (self.word_bits - 1))
+            self.qmax = (1 << (self.word_bits - 1)) - 1
+        else:
+            self.qmin, self.qmax = 0, (1 << self.word_bits) - 1
+        nbytes = 1 if self.word_bits <= 8 else 2 if self.word_bits <= 16 else 4 if self.word_bits <= 32 else 8
+        self.dtype = np.dtype(f"<{'i' if self.signed else 'u'}{nbytes}")
+        # UQx.y with 64 bits does not fit int64
+        self._code = np.dtype(np.uint64 if self.qmax > np.iinfo(np.int64).max else np.int64)
+        self.hex_digits = (self.word_bits + 3) // 4
+
+    @classmethod
+    def parse(cls, text):
+        """'Q1.15', 'Q4.12', 'UQ0.16' -> FixedPoint."""
+        m = re.fullmatch(r"\s*(U?)Q(\d+)\.(\d+)\s*", text, flags=re.I)
+        if not m:
+            raise ValueError(f"invalid fixed-point format: {text!r} (expected e.g. Q1.15)")
+        return cls(int(m.group(2)), int(m.group(3)), signed=not m.group(1))
+
+    def __str__(self):
+        return f"{'' if self.signed else 'U'}Q{self.int_bits}.{self.frac_bits}"
+
+    def quantize(self, v):
+        """Return (codes, number of saturated samples)."""
+        v = np.nan_to_num(np.asarray(v, dtype=float))
+        q = np.rint(v * float(1 << self.frac_bits))
+        # saturate in integer space: above 53 bits float(qmax) rounds up to
+        # qmax + 1, a power of two, so compare against that exact bound
+        lo = q < float(self.qmin)
+        hi = q >= float(self.qmax + 1)
+        codes = np.empty(q.shape, dtype=self._code)
+        ok = ~(lo | hi)
+        codes[ok] = q[ok]
+        codes[lo] = self.qmin
+        codes[hi] = self.qmax
+        return codes, int(np.count_nonzero(lo | hi))
+
+    def to_hex(self, q):
+        """Codes -> newline-terminated lowercase hex words (bytes)."""
+        u = q.astype(np.uint64) & np.uint64((1 << self.word_bits) - 1)
+        shifts = np.arange(self.hex_digits - 1, -1, -1, dtype=np.uint64) * np.uint64(4)
+        nib = (u[:, None] >> shifts) & np.uint64(0xF)
+        out = np.empty((len(u), self.hex_digits + 1), dtype=np.uint8)
+        out[:, :-1] = _HEX[nib.astype(np.intp)]
+        out[:, -1] = ord("\n")
+        return out.tobytes()
+
+
+class VectorStream:
+    """One exported signal, written incrementally in every requested format.
+
+    The raw binary file is a memory-mapped array when the total length is
+    known up front, otherwise a buffered append; text files are buffered.
+    A running SHA-256 is kept for every file.
+    """
+
+    def __init__(self, out_dir, name, fmt, formats=EXPORT_FORMATS, total=None,
+                 width=1, comment=""):
+        self.name = name
+        self.fmt = fmt
+        self.width = int(width)
+        self.total = total
+        self.count = 0
+        self.saturated = 0
+        self.files = {}
+        self._hash = {}
+        self._mm = None
+        self._fh = {}
+
+        base = os.path.join(out_dir, name)
+        for f in formats:
+            if f not in EXPORT_FORMATS:
+                raise ValueError(f"unknown export format: {f}")
+            path = f"{base}.{f}"
+            self.files[f] = path
+            self._hash[f] = hashlib.sha256()
+            if f == "bin" and total is not None:
+                n = max(1, int(total) * self.width)
+                self._mm = np.memmap(path, dtype=fmt.dtype, mode="w+", shape=(n,))
+            else:
+                self._fh[f] = open(path, "wb", buffering=_BUF)
+
+        if "mem" in self._fh:
+            head = f"// {name}: {fmt}, {self.width} word(s) per sample"
+            if comment:
+                head += f", {comment}"
+            head = (head + "\n@0\n").encode()
+            self._fh["mem"].write(head)
+            self._hash["mem"].update(head)
+
+    def write(self, v):
+        v = np.asarray(v, dtype=float).reshape(-1)
+        if v.size % self.width:
+            raise ValueError(f"{self.name}: block size not a multiple of {self.width}")
+        # bound the temporaries of quantisation/hex formatting
+        step = max(1, _BLOCK // self.width) * self.width
+        for i in range(0, v.size, step):
+            self._write_block(v[i:i + step])
+
+    def _write_block(self, v):
+        q, nsat = self.fmt.quantize(v)
+        self.saturated += nsat
+        raw = q.astype(self.fmt.dtype)
+
+        if "bin" in self.files:
+            if self._mm is not None:
+                i0 = self.count * self.width
+                if i0 + raw.size > self._mm.size:
+                    raise ValueError(f"{self.name}: more samples than announced ({self.total})")
+                self._mm[i0:i0 + raw.size] = raw
+            else:
+                self._fh["bin"].write(raw.tobytes())
+            self._hash["bin"].update(raw.tobytes())
+
+        if "hex" in self.files or "mem" in self.files:
+            text = self.fmt.to_hex(q)
+            for f in ("hex", "mem"):
+                if f in self._fh:
+                    self._fh[f].write(text)
+                    self._hash[f].update(text)
+
+        self.count += v.size // self.width
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm = None
+            if self.total is not None and self.count < self.total:
+                # shrink to what was actually written
+                with open(self.files["bin"], "r+b") as fh:
+                    fh.truncate(self.count * self.width * self.fmt.dtype.itemsize)
+        for fh in self._fh.values():
+            fh.close()
+        self._fh = {}
+
+        return dict(
+            samples=self.count,
+            words_per_sample=self.width,
+            saturated=self.saturated,
+            files={f: dict(path=os.path.basename(p), sha256=self._hash[f].hexdigest())
+                   for f, p in self.files.items()},
+        )
+
+
+class GoldenExporter:
+    """Collects VectorStreams in one directory and writes manifest.json."""
+
+    def __init__(self, out_dir, fmt="Q1.15", formats=EXPORT_FORMATS, params=None):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.fmt = FixedPoint.parse(fmt) if isinstance(fmt, str) else fmt
+        self.formats = tuple(formats)
+        self.params = dict(params or {})
+        self.streams = {}
+
+    def stream(self, name, total=None, width=1, offset=0, comment=""):
+        if name not in self.streams:
+            vs = VectorStream(self.out_dir, name, self.fmt, self.formats,
+                              total=total, width=width, comment=comment)
+            vs.offset = int(offset)
+            self.streams[name] = vs
+        return self.streams[name]
+
+    def write(self, name, v):
+        self.stream(name).write(v)
+
+    def close(self):
+        entries = {}
+        for name, vs in self.streams.items():
+            entries[name] = vs.close()
+            entries[name]["offset"] = vs.offset
+        manifest = dict(
+            format=dict(q=str(self.fmt), word_bits=self.fmt.word_bits,
+                        frac_bits=self.fmt.frac_bits, signed=self.fmt.signed,
+                        bin_dtype=self.fmt.dtype.str),
+            params=self.params,
+            streams=entries,
+        )
+        path = os.path.join(self.out_dir, "manifest.json")
+        with open(path, "w") as fh:
+            json.dump(manifest, fh, indent=2, default=_json_default)
+        return manifest
+
+
+def _json_default(o):
+    if isinstance(o, np.generic):
+        return o.item()
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    return str(o)
+
+
+def _index_info(idx):
+    """Sample indices of weight snapshots, compact when evenly spaced."""
+    idx = np.asarray(idx, dtype=int)
+    if len(idx) > 1 and np.all(np.diff(idx) == idx[1] - idx[0]):
+        return dict(first=int(idx[0]), step=int(idx[1] - idx[0]), count=len(idx))
+    return dict(index=idx.tolist())
+
+
+def export_run(out_dir, x, d, y, e, nt, weights=None, fmt="Q1.15",
+               formats=EXPORT_FORMATS, params=None):
+    """Export a finished run. x and d start at sample 0, y/e at sample nt-1;
+    weights is a WeightRecorder whose snapshots are written row by row
+    (transversal taps only: leave it out for subband and lattice runs)."""
+    ex = GoldenExporter(out_dir, fmt, formats, params)
+    N, M = len(x), len(y)
+    ex.stream("x", total=N, comment="input").write(x)
+    ex.stream("d", total=N, comment="desired").write(d)
+    ex.stream("y", total=M, offset=nt - 1, comment=f"output, starts at sample {nt - 1}").write(y)
+    ex.stream("e", total=M, offset=nt - 1, comment=f"error, starts at sample {nt - 1}").write(e)
+
+    if weights is not None and len(weights.w):
+        W = weights.w
+        ex.stream("w", total=len(W), width=W.shape[1],
+                  comment="row-major weight snapshots").write(W)
+        ex.params["w_snapshots"] = _index_info(weights.idx)
+    return ex.close()
+
+
+def export_chunked(out_dir, chunks, nt, fmt="Q1.15", formats=EXPORT_FORMATS,
+                   params=None, total=None, recorder=None):
+    """Export from iter_filter_chunks() without holding the whole run.
+
+    `recorder` is the one given to iter_filter_chunks(). Snapshots of an
+    "every" recorder come with the chunks and are streamed as they arrive;
+    a "ring" or "final" recorder is written at the end.
+    """
+    ex = GoldenExporter(out_dir, fmt, formats, params)
+    n_out = None if total is None else max(0, total - nt + 1)
+    sx = ex.stream("x", total=total, comment="input")
+    sd = ex.stream("d", total=total, comment="desired")
+    sy = ex.stream("y", total=n_out, offset=nt - 1, comment=f"output, starts at sample {nt - 1}")
+    se = ex.stream("e", total=n_out, offset=nt - 1, comment=f"error, starts at sample {nt - 1}")
+    sw, w_idx = None, None         # w_idx: first/step/count of the snapshots
+    for c in chunks:
+        sx.write(c["x"])
+        sd.write(c["d"])
+        sy.write(c["y"])
+        se.write(c["e"])
+        W = c.get("w")
+        if W is not None and len(W):
+            if sw is None:
+                sw = ex.stream("w", width=W.shape[1], comment="row-major weight snapshots")
+                w_idx = dict(first=int(c["w_idx"][0]), step=recorder.every, count=0)
+            sw.write(W)
+            w_idx["count"] += len(W)
+
+    if sw is not None:
+        ex.params["w_snapshots"] = w_idx
+    elif recorder is not None and len(recorder.w):
+        W = recorder.w
+        ex.stream("w", total=len(W), width=W.shape[1],
+                  comment="row-major weight snapshots").write(W)
+        ex.params["w_snapshots"] = _index_info(recorder.idx)
+    return ex.close()
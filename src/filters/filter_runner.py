@@ -1,6 +1,28 @@
 import numpy as np
 import padasip as pa
 from .safety import clamp_array, is_diverged
+from .weight_history import WeightRecorder
+from .signal_generation import hist_input
+from .scenarios import iter_scenario
+from .subband import SUBBAND_ALGS, make_subband_filter, run_subband_filter
+from .lattice import LATTICE_ALGS, make_lattice_filter, run_lattice_filter
+
+RUN_CHUNK = 4096
+
+# padasip keeps an N x nt regressor matrix (and RLS an nt x nt matrix), so
+# only the subband engine, whose cost per sample is ~nt/D, gets long filters
+MAX_TAPS = 512
+MAX_TAPS_SUBBAND = 8192
+
+
+def max_taps(name):
+    return MAX_TAPS_SUBBAND if name in SUBBAND_ALGS else MAX_TAPS
+
+
+def check_taps(name, nt):
+    if not 1 <= nt <= max_taps(name):
+        raise ValueError(f"{name} supports 1..{max_taps(name)} taps, got nt={nt}.")
+
 
 def enforce_runtime_stability(alg, params, LIMITS):
     p = params
@@ -22,40 +44,106 @@ def enforce_runtime_stability(alg, params, LIMITS):
         lo, hi = LIMITS["AP"]["mu"]
         p["mu"] = float(np.clip(p["mu"], lo, min(hi, mu_max)))
 
-    # RLS
-    if alg == "RLS":
-        lo, hi = LIMITS["RLS"]["mu"]
+    # subband engines: even band count, NLMS-style mu bound
+    if alg in ("SAF-LMS", "SAF-NLMS"):
+        lo, hi = LIMITS[alg]["bands"]
+        bands = int(np.clip(int(round(p.get("bands", 16))), lo, hi))
+        p["bands"] = bands + bands % 2
+        if alg == "SAF-NLMS":
+            lo, hi = LIMITS[alg]["mu"]
+            p["mu"] = float(np.clip(p["mu"], lo, min(1.95, hi)))
+
+    # lattice: ladder misadjustment compounds over the orders, keep steps small
+    if alg == "GAL":
+        for k in ("mu", "mu_k", "beta"):
+            lo, hi = LIMITS[alg][k]
+            p[k] = float(np.clip(p[k], lo, hi))
+
+    # RLS and the least-squares lattice
+    if alg in ("RLS", "LSL"):
+        lo, hi = LIMITS[alg]["mu"]
         p["mu"] = float(np.clip(p["mu"], lo, hi))
-        lo2, hi2 = LIMITS["RLS"]["eps"]
+        lo2, hi2 = LIMITS[alg]["eps"]
         p["eps"] = float(np.clip(p["eps"], lo2, hi2))
 
     return p
 
 
-def run_padasip_filter(name, d, X, params):
-    n = X.shape[1]
+def make_filter(name, n, params):
     p = params
 
     if name == "LMS":
-        flt = pa.filters.FilterLMS(n, mu=p["mu"])
+        return pa.filters.FilterLMS(n, mu=p["mu"])
     elif name == "NLMS":
-        flt = pa.filters.FilterNLMS(n, mu=p["mu"], eps=p["eps"])
+        return pa.filters.FilterNLMS(n, mu=p["mu"], eps=p["eps"])
     elif name == "RLS":
-        flt = pa.filters.FilterRLS(n, mu=p["mu"], eps=p["eps"])
+        return pa.filters.FilterRLS(n, mu=p["mu"], eps=p["eps"])
     elif name == "AP":
-        flt = pa.filters.FilterAP(n, mu=p["mu"], order=p["order"], ifc=p["ifc"])
+        return pa.filters.FilterAP(n, mu=p["mu"], order=p["order"], ifc=p["ifc"])
     elif name == "SSLMS":
-        flt = pa.filters.FilterSSLMS(n, mu=p["mu"])
+        return pa.filters.FilterSSLMS(n, mu=p["mu"])
     elif name == "Llncosh":
-        flt = pa.filters.FilterLlncosh(n, mu=p["mu"], lambd=p["lambd"])
+        return pa.filters.FilterLlncosh(n, mu=p["mu"], lambd=p["lambd"])
     elif name == "GMCC":
-        flt = pa.filters.FilterGMCC(n, mu=p["mu"], lambd=p["lambd"], alpha=p["alpha"])
+        return pa.filters.FilterGMCC(n, mu=p["mu"], lambd=p["lambd"], alpha=p["alpha"])
     elif name == "GNGD":
-        flt = pa.filters.FilterGNGD(n, mu=p["mu"], eps=p["eps"], ro=p["ro"])
+        return pa.filters.FilterGNGD(n, mu=p["mu"], eps=p["eps"], ro=p["ro"])
     else:
         raise ValueError("Unknown algorithm")
 
-    y, e, w = flt.run(d, X)
+
+# parameters that only seed internal state: GNGD adapts its eps itself,
+# RLS and LSL use eps only for the initial correlation estimate
+INIT_ONLY_PARAMS = {"GNGD": ("eps",), "RLS": ("eps",), "LSL": ("eps",)}
+
+
+def changed_params(name, params, old):
+    """Entries of `params` that differ from `old`, minus INIT_ONLY_PARAMS."""
+    skip = INIT_ONLY_PARAMS.get(name, ())
+    return {k: v for k, v in params.items()
+            if k not in skip and (old is None or old.get(k) != v)}
+
+
+def retune_filter(flt, name, params, old=None):
+    """Apply new parameters to a running filter, keeping its weights.
+
+    Only parameters that differ from `old` (the ones the filter runs with;
+    None: all) are set, so adaptive state is not reset on every call.
+    padasip stores the parameters under the same names as PARAMS; AP's
+    projection order and regularisation shape its internal matrices, so a
+    change there rebuilds the filter around the current weights.
+    """
+    p = changed_params(name, params, old)
+    if name == "AP" and ("order" in p or "ifc" in p):
+        new = make_filter(name, flt.n, params)
+        new.w = flt.w.copy()
+        return new
+
+    for k, v in p.items():
+        setattr(flt, k, v)
+    return flt
+
+
+def run_padasip_filter(name, d, X, params, recorder=None, chunk=RUN_CHUNK):
+    """Run `name` over (d, X) and return (y, e, recorder).
+
+    padasip keeps the filter state between run() calls, so the signal is fed
+    in blocks of `chunk` samples and only one block of weight history exists
+    at a time; `recorder` (a WeightRecorder, default: final weights only)
+    decides which snapshots are kept.
+    """
+    flt = make_filter(name, X.shape[1], params)
+    if recorder is None:
+        recorder = WeightRecorder("final")
+
+    N = len(d)
+    y = np.zeros(N)
+    e = np.zeros(N)
+    for k0 in range(0, N, chunk):
+        k1 = min(k0 + chunk, N)
+        y[k0:k1], e[k0:k1], W = flt.run(d[k0:k1], X[k0:k1])
+        recorder.push(W, k0)
+    recorder.finish(flt.w, N)
 
     y = clamp_array(y)
     e = clamp_array(e)
@@ -63,4 +151,118 @@ def run_padasip_filter(name, d, X, params):
     if is_diverged(y, e):
         raise RuntimeError("Adaptive filter diverged")
 
-    return y, e, w
+    return y, e, recorder
+
+
+def run_filter(name, d, x, nt, params, recorder=None):
+    """Run any engine on input `x` (full length) and desired `d` = target[nt-1:].
+
+    padasip filters get the nt-tap regressor matrix; subband and lattice
+    engines take x[nt-1:] directly and compensate their own delay.
+    """
+    check_taps(name, nt)
+    if name in SUBBAND_ALGS:
+        return run_subband_filter(name, d, x[nt - 1:], nt, params, recorder=recorder)
+    if name in LATTICE_ALGS:
+        return run_lattice_filter(name, d, x[nt - 1:], nt, params, recorder=recorder)
+    return run_padasip_filter(name, d, hist_input(x, nt), params, recorder=recorder)
+
+
+def iter_filter_chunks(name, scn, nt, params, chunk=65536, recorder=None):
+    """Stream a scenario through one filter, chunk by chunk.
+
+    Yields dicts with the chunk's first sample index `k0`, the raw input
+    `x` and desired `d` for samples k0..k1-1, and `y`/`e` for the samples
+    of that range the filter produced (the first nt-1 samples of the
+    signal have none). y/e are identical to a one-shot run_filter over the
+    whole signal; only `chunk` samples are held at a time.
+
+    Subband and lattice engines answer `delay` samples late, so their y/e
+    run behind x/d and the rest comes in one last chunk with empty x/d.
+    Their weights are not transversal taps and are not recorded.
+
+    An "every" recorder does not collect the history here: each chunk
+    carries its snapshots as `w` (rows) and `w_idx` instead, so the
+    consumer can write them out as they arrive. "ring" and "final"
+    recorders are bounded and are filled as usual.
+    """
+    check_taps(name, nt)
+    if recorder is None:
+        recorder = WeightRecorder("final")
+    if name in SUBBAND_ALGS or name in LATTICE_ALGS:
+        yield from _iter_blockwise_chunks(name, scn, nt, params, chunk, recorder)
+        return
+    flt = make_filter(name, nt, params)
+
+    hist = np.zeros(0)
+    n_out = 0
+    w, w_idx = np.zeros((0, 0)), np.zeros(0, dtype=int)
+    for k0, t, s, x in iter_scenario(scn, chunk=chunk):
+        d = s[0] if isinstance(s, tuple) else s
+        xx = np.concatenate([hist, x])
+        skip = nt - 1 - len(hist)       # leading samples without full history
+        hist = xx[-(nt - 1):] if nt > 1 else np.zeros(0)
+
+        if len(xx) >= nt:
+            X = hist_input(xx, nt)
+            y, e, W = flt.run(d[skip:], X)
+            if recorder.mode == "every":
+                w, w_idx = recorder.select(W, n_out)
+            else:
+                recorder.push(W, n_out)
+            n_out += len(y)
+            y = clamp_array(y)
+            e = clamp_array(e)
+            if is_diverged(y, e):
+                raise RuntimeError("Adaptive filter diverged")
+        else:
+            y = e = np.zeros(0)
+            w, w_idx = np.zeros((0, 0)), np.zeros(0, dtype=int)
+
+        yield dict(k0=k0, t=t, x=x, d=d, y=y, e=e, offset=skip, w=w, w_idx=w_idx)
+
+    recorder.finish(flt.w, n_out)
+
+
+def _iter_blockwise_chunks(name, scn, nt, params, chunk, recorder):
+    subband = name in SUBBAND_ALGS
+    flt = (make_subband_filter if subband else make_lattice_filter)(name, nt, params)
+    n_out = None
+    n_made = 0                          # outputs produced, including the delay
+    n_sent = 0
+    empty = np.zeros(0)
+
+    def emit(y, e):
+        nonlocal n_made, n_sent
+        # drop the first `delay` outputs and whatever the flush adds past the end
+        i0 = max(0, flt.delay - n_made)
+        n_made += len(y)
+        y, e = y[i0:], e[i0:]
+        if n_out is not None:
+            y, e = y[:n_out - n_sent], e[:n_out - n_sent]
+        n_sent += len(y)
+        y = clamp_array(y)
+        e = clamp_array(e)
+        if is_diverged(y, e):
+            raise RuntimeError("Adaptive filter diverged")
+        return y, e
+
+    n_in = 0
+    for k0, t, s, x in iter_scenario(scn, chunk=chunk):
+        d = s[0] if isinstance(s, tuple) else s
+        skip = min(len(x), max(0, nt - 1 - k0))
+        y, e = emit(*flt.process(x[skip:], d[skip:]))
+        n_in += len(x) - skip
+        yield dict(k0=k0, t=t, x=x, d=d, y=y, e=e, offset=skip,
+                   w=np.zeros((0, 0)), w_idx=np.zeros(0, dtype=int))
+
+    # flush the pipeline like run_subband_filter / run_lattice_filter
+    n_out = n_in
+    if subband:
+        pad = np.zeros(flt.delay + flt.fb_x.D)
+        y, e = emit(*flt.process(pad, pad, adapt=False))
+    else:
+        pad = np.zeros(flt.delay)
+        y, e = emit(*flt.process(pad, pad))
+    yield dict(k0=n_in + nt - 1, t=empty, x=empty, d=empty, y=y, e=e, offset=0,
+               w=np.zeros((0, 0)), w_idx=np.zeros(0, dtype=int))
@@ -0,0 +1,349 @@
+import numpy as np
+
+from .safety import SAFE_MAX, clamp_array, is_diverged
+from .weight_history import WeightRecorder
+
+LATTICE_ALGS = ("GAL", "LSL")
+
+# tail length of compute_metrics' MSE_end
+_MSE_TAIL = 2000
+_K_MAX = 0.999
+
+
+class GradientLattice:
+    """Gradient adaptive lattice (GAL) joint-process estimator.
+
+    The lattice orthogonalises the input into backward errors b_0..b_{N-1};
+    the ladder estimates d from them one stage at a time, so the error after
+    stage m is the error of an order m+1 transversal filter. One pass
+    therefore gives the error of every order 1..N.
+
+    Stage m at sample n only needs stage m-1 at sample n, so stages are run
+    along a skewed schedule (stage m lags stage 0 by m samples) with one
+    vector operation over all stages per step. process() returns the
+    order-N output delayed by `delay` = N-1 samples and, on request, the
+    skewed per-stage errors.
+
+    Every stage adapts on its own error, which stays at the order-m
+    residual, so the ladder jitter of low orders is passed on to all
+    higher ones: the excess MSE grows roughly like (1 + mu/2)**m. Keep
+    mu small for long lattices, or use LeastSquaresLattice.
+    """
+
+    def __init__(self, order, mu=0.02, mu_k=0.01, beta=0.99, eps=1e-3):
+        N = int(order)
+        if N < 1:
+            raise ValueError("lattice order must be >= 1")
+        self.order = N
+        self.mu = float(mu)
+        self.mu_k = float(mu_k)
+        self.beta = float(beta)
+        self.eps = float(eps)
+
+        self.k = np.zeros(N)        # reflection coefficients (k[0] unused)
+        self.c = np.zeros(N)        # ladder weights
+        self._P = np.zeros(N)       # forward + backward input power per stage
+        self._Pb = np.zeros(N)      # backward error power per stage
+        # weight of the exponential averages so far; dividing by it removes
+        # the start-up bias that would otherwise blow up the first steps
+        self._W = np.zeros(N)
+        self._steps = 0
+
+        # pipeline registers: what stage m consumes on the next step
+        self._f_in = np.zeros(N)    # f_{m-1}(n)
+        self._b_in = np.zeros(N)    # b_{m-1}(n-1)
+        self._e_in = np.zeros(N)    # d(n) minus the first m ladder terms
+        self._y_in = np.zeros(N)    # the first m ladder terms
+        self._b_out = np.zeros(N)   # b_m of the previous step
+
+    @property
+    def delay(self):
+        return self.order - 1
+
+    def process(self, x, d, stages=False):
+        """Feed a block; returns (y, e) of the full order, `delay` samples late.
+
+        With stages=True also returns E with E[i, m] = error of order m+1
+        at sample n = k0 + i - m (k0: first sample of this block).
+        """
+        x = np.asarray(x, float)
+        d = np.asarray(d, float)
+        n_in = len(x)
+        y = np.zeros(n_in)
+        e = np.zeros(n_in)
+        E = np.zeros((n_in, self.order)) if stages else None
+
+        k, c, P, Pb, W = self.k, self.c, self._P, self._Pb, self._W
+        f_in, b_in, e_in, y_in = self._f_in, self._b_in, self._e_in, self._y_in
+        b_out = self._b_out
+        a = 1.0 - self.beta
+        stage = np.arange(self.order)
+
+        for i in range(n_in):
+            # stage m sees its first sample on step m
+            W *= self.beta
+            W += a * (stage <= self._steps)
+            self._steps += 1
+            w = np.maximum(W, a)
+
+            f_in[0] = x[i]
+            b_in[0] = 0.0
+            e_in[0] = d[i]
+            y_in[0] = 0.0
+
+            # lattice stages: f_m = f_{m-1} + k b_{m-1}(n-1), b_m = b_{m-1}(n-1) + k f_{m-1}
+            f = f_in + k * b_in
+            b = b_in + k * f_in
+            b[0] = x[i]
+            P *= self.beta
+            P += a * (f_in * f_in + b_in * b_in)
+            k -= self.mu_k * (f * b_in + b * f_in) / (P / w + self.eps)
+            k[0] = 0.0
+            # |k| < 1 keeps the lattice minimum phase
+            np.clip(k, -_K_MAX, _K_MAX, out=k)
+
+            # ladder (joint process): order m+1 error from order m error;
+            # the b_m are (nearly) orthogonal, so every stage is a one-tap
+            # NLMS filter normalised by the averaged power of its own b_m
+            # (never less than b_m^2, which bounds the start-up steps)
+            ym = y_in + c * b
+            em = e_in - c * b
+            Pb *= self.beta
+            Pb += a * b * b
+            c += self.mu * em * b / (np.maximum(Pb / w, b * b) + self.eps)
+
+            y[i] = ym[-1]
+            e[i] = em[-1]
+            if stages:
+                E[i] = em
+
+            # hand every stage's output to the next stage
+            f_in[1:] = f[:-1]
+            b_in[1:] = b_out[:-1]
+            e_in[1:] = em[:-1]
+            y_in[1:] = ym[:-1]
+            b_out[:] = b
+
+        if not np.all(np.isfinite(c)) or np.max(np.abs(c)) > SAFE_MAX:
+            raise RuntimeError("Adaptive filter diverged")
+
+        return (y, e, E) if stages else (y, e)
+
+
+class LeastSquaresLattice:
+    """Recursive least-squares lattice (LSL), a posteriori form.
+
+    Same structure and skewed schedule as GradientLattice, but reflection
+    and ladder coefficients are exact exponentially weighted least-squares
+    solutions (forgetting factor `mu`, as for RLS), so the error of order m
+    is that of an order-m RLS filter and does not depend on what the lower
+    stages went through. Returned errors are a priori (d minus the estimate
+    from the previous coefficients), like padasip's. The memory 1/(1-mu)
+    should be well above the order, or the higher orders over-fit.
+    """
+
+    def __init__(self, order, mu=0.999, eps=1e-2):
+        N = int(order)
+        if N < 1:
+            raise ValueError("lattice order must be >= 1")
+        self.order = N
+        self.mu = float(mu)
+        self.eps = float(eps)
+
+        self.c = np.zeros(N)        # ladder weights kappa_m
+        self._D = np.zeros(N)       # forward/backward cross-correlation Delta_m
+        self._R = np.zeros(N)       # backward error / d cross-correlation rho_m
+        self._F0 = self.eps         # input energy (forward energy of order 0)
+
+        # pipeline registers: what stage m consumes on the next step
+        self._f_in = np.zeros(N)            # f_{m-1}(n)
+        self._F_in = np.full(N, self.eps)   # F_{m-1}(n)
+        self._e_in = np.zeros(N)            # a posteriori error of order m
+        self._g_in = np.ones(N)             # conversion factor of order m
+        self._d_in = np.zeros(N)            # d(n) itself
+        self._b_in = np.zeros(N)            # b_{m-1}(n-1)
+        self._B_in = np.full(N, self.eps)   # B_{m-1}(n-1)
+        self._gb_in = np.ones(N)            # conversion factor of order m-1 at n-1
+        self._b_out = np.zeros(N)           # b_m, B_m, gamma_m of the previous step
+        self._B_out = np.full(N, self.eps)
+        self._g_out = np.ones(N)
+
+    @property
+    def delay(self):
+        return self.order - 1
+
+    def process(self, x, d, stages=False):
+        """Feed a block; same outputs as GradientLattice.process()."""
+        x = np.asarray(x, float)
+        d = np.asarray(d, float)
+        n_in = len(x)
+        y = np.zeros(n_in)
+        e = np.zeros(n_in)
+        E = np.zeros((n_in, self.order)) if stages else None
+
+        lam = self.mu
+        c, D, R = self.c, self._D, self._R
+        f_in, F_in, e_in, g_in = self._f_in, self._F_in, self._e_in, self._g_in
+        d_in = self._d_in
+        b_in, B_in, gb_in = self._b_in, self._B_in, self._gb_in
+        b_out, B_out, g_out = self._b_out, self._B_out, self._g_out
+        tiny = 1e-300
+
+        for i in range(n_in):
+            self._F0 = lam * self._F0 + x[i] * x[i]
+            f_in[0] = x[i]
+            F_in[0] = self._F0
+            e_in[0] = d[i]
+            g_in[0] = 1.0
+            d_in[0] = d[i]
+
+            # lattice stages (stage 0 passes the input through: f_0 = b_0 = x)
+            D *= lam
+            D += b_in * f_in / gb_in
+            f = f_in - D / B_in * b_in
+            b = b_in - D / F_in * f_in
+            F = np.maximum(F_in - D * D / B_in, tiny)
+            B = np.maximum(B_in - D * D / F_in, tiny)
+            D[0] = 0.0
+            f[0] = b[0] = x[i]
+            F[0] = B[0] = self._F0
+
+            # ladder: a posteriori error of order m+1, and the a priori
+            # one through the conversion factor gamma_{m+1}
+            R *= lam
+            R += b * e_in / g_in
+            c[:] = R / B
+            em = e_in - c * b
+            g = np.clip(g_in - b * b / B, tiny, 1.0)
+            ea = em / g
+
+            y[i] = d_in[-1] - ea[-1]
+            e[i] = ea[-1]
+            if stages:
+                E[i] = ea
+
+            # hand every stage's output to the next stage
+            b_in[1:] = b_out[:-1]
+            B_in[1:] = B_out[:-1]
+            gb_in[1:] = g_out[:-1]
+            b_out[:] = b
+            B_out[:] = B
+            g_out[:] = g_in
+            f_in[1:] = f[:-1]
+            F_in[1:] = F[:-1]
+            e_in[1:] = em[:-1]
+            g_in[1:] = g[:-1]
+            d_in[1:] = d_in[:-1]
+
+        if not np.all(np.isfinite(c)) or np.max(np.abs(c)) > SAFE_MAX:
+            raise RuntimeError("Adaptive filter diverged")
+
+        return (y, e, E) if stages else (y, e)
+
+
+def make_lattice_filter(name, nt, params):
+    p = params
+    if name == "GAL":
+        return GradientLattice(nt, mu=p["mu"], mu_k=p["mu_k"], beta=p["beta"], eps=p["eps"])
+    if name == "LSL":
+        return LeastSquaresLattice(nt, mu=p["mu"], eps=p["eps"])
+    raise ValueError("Unknown algorithm")
+
+
+def run_lattice_filter(name, d, x, nt, params, recorder=None, chunk=4096):
+    """Run the order-`nt` lattice over input `x` and desired `d` (same length).
+
+    Output is compensated for the pipeline delay like run_subband_filter's.
+    Only the final ladder weights are recorded (they weight the backward
+    errors, not delayed inputs, so they are not transversal taps).
+    """
+    flt = make_lattice_filter(name, nt, params)
+    if recorder is None:
+        recorder = WeightRecorder("final")
+
+    N = len(d)
+    x = np.asarray(x, float)
+    d = np.asarray(d, float)
+    ys, es = [], []
+    for k0 in range(0, N, chunk):
+        y_b, e_b = flt.process(x[k0:k0 + chunk], d[k0:k0 + chunk])
+        ys.append(y_b)
+        es.append(e_b)
+
+    # flush the pipeline; the padding only reaches stages whose output is discarded
+    pad = np.zeros(flt.delay)
+    y_b, e_b = flt.process(pad, pad)
+    ys.append(y_b)
+    es.append(e_b)
+
+    y = np.concatenate(ys)[flt.delay:flt.delay + N]
+    e = np.concatenate(es)[flt.delay:flt.delay + N]
+    recorder.finish(flt.c.copy(), N)
+
+    y = clamp_array(y)
+    e = clamp_array(e)
+
+    if is_diverged(y, e):
+        raise RuntimeError("Adaptive filter diverged")
+
+    return y, e, recorder
+
+
+def lattice_order_sweep(d, x, max_order, params, name="LSL", chunk=None):
+    """MSE_end and N90% for every filter order 1..max_order in one pass.
+
+    `x` and `d` are the full-length input and desired signals (d[n] is
+    estimated from x[n], x[n-1], ...). For order m the metrics follow
+    compute_metrics on the error from sample m-1 on, i.e. the samples a
+    transversal filter with m taps would produce. The default LSL engine
+    gives the same per-order errors as separate RLS runs; GAL's higher
+    orders carry the misadjustment of the lower ones.
+
+    Returns dict(order, mse, n90) of arrays indexed by order-1.
+    """
+    x = np.asarray(x, float)
+    d = np.asarray(d, float)
+    L = len(x)
+    N = int(min(max_order, L))
+    flt = make_lattice_filter(name, N, params)
+
+    m = np.arange(N)                    # stage m -> order m+1, first sample n = m
+    tail_start = L - np.minimum(_MSE_TAIL, L - m)
+    e0 = np.full(N, np.nan)             # squared error at the first sample
+    n90 = np.full(N, -1)
+    tail = np.zeros(N)
+
+    # bound the skewed error block to a few million values
+    if chunk is None:
+        chunk = int(np.clip(4_000_000 // N, 256, 16384))
+
+    for k0 in range(0, L + N - 1, chunk):
+        k1 = min(k0 + chunk, L + N - 1)
+        xb = x[k0:k1] if k0 < L else np.zeros(0)
+        db = d[k0:k1] if k0 < L else np.zeros(0)
+        pad = (k1 - k0) - len(xb)
+        if pad:
+            xb = np.concatenate([xb, np.zeros(pad)])
+            db = np.concatenate([db, np.zeros(pad)])
+
+        _, _, E = flt.process(xb, db, stages=True)
+        sq = np.minimum(E * E, SAFE_MAX)
+        n = np.arange(k0, k1)[:, None] - m[None, :]
+        valid = (n >= m) & (n < L)
+
+        first = valid & (n == m)
+        rows, cols = np.nonzero(first)
+        e0[cols] = sq[rows, cols]
+
+        hit = valid & (n90 < 0) & (sq <= 0.1 * e0)
+        hit_any = hit.any(axis=0)
+        if hit_any.any():
+            first_hit = np.argmax(hit, axis=0)
+            cols = np.nonzero(hit_any)[0]
+            n90[cols] = n[first_hit[cols], cols] - m[cols]
+
+        tail += np.sum(np.where(valid & (n >= tail_start), sq, 0.0), axis=0)
+
+    n90 = np.where(n90 < 0, L - m, n90)
+    mse = tail / (L - tail_start) + 1e-15
+    return dict(order=m + 1, mse=mse, n90=n90)
@@ -0,0 +1,153 @@
+import numpy as np
+from scipy.signal import lfilter
+
+from .filter_runner import make_filter, retune_filter, changed_params, check_taps
+from .subband import SUBBAND_ALGS, make_subband_filter
+from .lattice import LATTICE_ALGS, make_lattice_filter
+from .scenarios import scenario_spec, generate_chunk
+from .safety import clamp_array, safe_square, safe_db_from_square, is_diverged
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer; push() overwrites the oldest samples."""
+
+    def __init__(self, capacity):
+        self.capacity = max(1, int(capacity))
+        self._buf = np.zeros(self.capacity)
+        self._pos = 0
+        self.count = 0
+
+    def push(self, v):
+        v = np.asarray(v, dtype=float)[-self.capacity:]
+        n = len(v)
+        if n == 0:
+            return
+        end = self._pos + n
+        if end <= self.capacity:
+            self._buf[self._pos:end] = v
+        else:
+            k = self.capacity - self._pos
+            self._buf[self._pos:] = v[:k]
+            self._buf[:n - k] = v[k:]
+        self._pos = end % self.capacity
+        self.count = min(self.capacity, self.count + n)
+
+    def values(self):
+        """Contents, oldest first (a copy)."""
+        if self.count < self.capacity:
+            return self._buf[:self.count].copy()
+        return np.concatenate([self._buf[self._pos:], self._buf[:self._pos]])
+
+
+class LiveSession:
+    """Endless, stateful simulation of one filter on a scenario stream.
+
+    step(n) generates the next n samples, runs them through the filter
+    (weights persist between steps) and appends x/d/s/y/e and a smoothed
+    MSE (dB) to ring buffers holding the last `window` samples. Memory and
+    per-step cost do not grow with the running time.
+    """
+
+    def __init__(self, alg, params, nt, scn, window, mse_tau=0.05):
+        self.alg = alg
+        self.nt = int(nt)
+        check_taps(alg, self.nt)
+        self.spec = scenario_spec(scn, T=None)
+        self.fs = float(self.spec["fs"])
+        self.k = 0                      # next sample index to generate
+
+        # subband and lattice engines take x directly and answer late
+        self.subband = alg in SUBBAND_ALGS
+        self.blockwise = self.subband or alg in LATTICE_ALGS
+        if self.subband:
+            self.flt = make_subband_filter(alg, self.nt, params)
+            self.lag = self.flt.delay
+        elif self.blockwise:
+            self.flt = make_lattice_filter(alg, self.nt, params)
+            self.lag = self.flt.delay
+        else:
+            self.flt = make_filter(alg, self.nt, params)
+            self.lag = 0
+        self.params = dict(params)
+
+        self._xhist = np.zeros(max(0, self.nt - 1))
+        self._reset_delay()
+
+        # exponential smoothing of e^2 for the live MSE trace
+        self._a = float(np.exp(-1.0 / max(1.0, mse_tau * self.fs)))
+        self._mse = None
+
+        cap = max(2, int(window * self.fs))
+        self.rings = {k: RingBuffer(cap) for k in ("t", "x", "d", "s", "y", "e", "mse")}
+
+    def _reset_delay(self):
+        # t, x, d, s waiting for y/e; the first `lag` outputs belong to the
+        # samples before the current one, which are stood in for by zeros
+        self._delay = np.zeros((4, self.lag))
+        self._delay[0] = (self.k - self.lag + np.arange(self.lag)) / self.fs
+
+    def set_params(self, params):
+        """Apply parameter changes without resetting the weights."""
+        if self.subband:
+            if int(params["bands"]) != self.flt.fb_x.M:
+                # the filter-bank layout changes; weights cannot carry over
+                self.flt = make_subband_filter(self.alg, self.nt, params)
+                self.lag = self.flt.delay
+                self._reset_delay()
+            else:
+                self.flt.mu = float(params["mu"])
+                self.flt.eps = float(params.get("eps", self.flt.eps))
+        elif self.blockwise:
+            for k, v in changed_params(self.alg, params, self.params).items():
+                setattr(self.flt, k, float(v))
+        else:
+            self.flt = retune_filter(self.flt, self.alg, params, self.params)
+        self.params = dict(params)
+
+    def step(self, n):
+        k0, k1 = self.k, self.k + int(n)
+        self.k = k1
+        t, s, x = generate_chunk(self.spec, k0, k1)
+        if isinstance(s, tuple):
+            d, s = s
+        else:
+            d = s
+
+        if self.blockwise:
+            y, e = self.flt.process(x, d)
+            # t/x/d/s are held back by the engine's delay to line up with
+            # y/e; the subband engine answers in whole hops, so take out as
+            # many samples as it returned, not as were fed in
+            txds = np.concatenate([self._delay, np.vstack([t, x, d, s])], axis=1)
+            self._delay = txds[:, len(y):]
+            t, x, d, s = txds[:, :len(y)]
+        else:
+            xx = np.concatenate([self._xhist, x])
+            self._xhist = xx[len(x):]
+            X = np.lib.stride_tricks.sliding_window_view(xx, self.nt)[:, ::-1]
+            y, e, _ = self.flt.run(d, X)
+
+        y = clamp_array(y)
+        e = clamp_array(e)
+        if is_diverged(y, e):
+            raise RuntimeError("Adaptive filter diverged")
+
+        self.rings["t"].push(t)
+        self.rings["x"].push(x)
+        self.rings["d"].push(d)
+        self.rings["s"].push(s)
+        self.rings["y"].push(y)
+        self.rings["e"].push(e)
+        self.rings["mse"].push(self._smooth_mse(e))
+
+    def _smooth_mse(self, e):
+        if len(e) == 0:                 # a step shorter than one subband hop
+            return np.zeros(0)
+        sq = safe_square(e)
+        zi = np.array([self._a * (sq[0] if self._mse is None else self._mse)])
+        m, _ = lfilter([1 - self._a], [1, -self._a], sq, zi=zi)
+        self._mse = m[-1]
+        return safe_db_from_square(m)
+
+    def window(self):
+        return {k: r.values() for k, r in self.rings.items()}
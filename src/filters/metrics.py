@@ -59,3 +59,11 @@ def compute_metrics(s, x, y, e, nt, anc=False):
         dsnr=snr_out - snr_in,
         n90=n90
     )
+
+
+def weight_misalignment_db(W, w_ref):
+    W = np.nan_to_num(np.asarray(W, float))
+    w_ref = np.nan_to_num(np.asarray(w_ref, float))
+    num = np.sum((W - w_ref)**2, axis=-1)
+    den = float(np.sum(w_ref**2)) + 1e-15
+    return 10 * np.log10(num / den + 1e-15)
@@ -0,0 +1,152 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from .signal_generation import make_inputs
+from .filter_runner import run_filter
+from .metrics import compute_metrics
+from .safety import clamp_array, is_diverged
+
+# niceness added to the worker processes so the GUI keeps the CPU
+PRECOMPUTE_NICE = 10
+# results hold full-length y/e and the weight history of a run
+PRECOMPUTE_CACHE_BYTES = 256 << 20
+
+
+def _lower_priority():
+    if hasattr(os, "nice"):
+        try:
+            os.nice(PRECOMPUTE_NICE)
+        except OSError:
+            pass
+
+
+def _precompute_worker(cfg, scn, alg, params, recorder):
+    """One run_once() without the plotting; errors come back as text."""
+    try:
+        t, s, x = make_inputs(cfg, scn)
+        nt, anc = cfg["nt"], cfg["anc"]
+        if nt > len(t):
+            raise ValueError(f"Taps nt ({nt}) larger than signal length ({len(t)}).")
+        d = (s[0] if anc else s)[nt - 1:]
+
+        y, e, rec = run_filter(alg, d, x, nt, params, recorder=recorder)
+        y = clamp_array(y)
+        e = clamp_array(e)
+        if is_diverged(y, e):
+            raise RuntimeError("Filter diverged — reduce mu or adjust parameters.")
+        m = compute_metrics(s, x, y, e, nt, anc=anc)
+        return dict(y=y, e=e, w=rec, metrics=m, params=params)
+    except Exception as ex:
+        return dict(error=str(ex), params=params)
+
+
+def _nbytes(res):
+    """Approximate memory held by one worker result."""
+    n = sum(a.nbytes for a in (res.get("y"), res.get("e")) if a is not None)
+    rec = res.get("w")
+    if rec is not None:
+        n += rec.w.nbytes + rec.idx.nbytes
+    return n
+
+
+def _result(fut):
+    try:
+        return fut.result()
+    except Exception as ex:      # e.g. a worker process died
+        return dict(error=str(ex))
+
+
+class PresetPrecomputer:
+    """Speculative runs on idle, low-priority worker processes.
+
+    submit() replaces the current batch: jobs not started yet are
+    cancelled and results of jobs already running are dropped when they
+    arrive. Finished results are kept in a small LRU cache under the key
+    they were submitted with, bounded by entry count and by `cache_bytes`;
+    poll() moves newly finished jobs there.
+    """
+
+    def __init__(self, max_workers=None, cache_size=32, cache_bytes=PRECOMPUTE_CACHE_BYTES):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.cache_size = int(cache_size)
+        self.cache_bytes = int(cache_bytes)
+        self._cache = OrderedDict()
+        self._sizes = {}
+        self._pending = {}
+        self._ex = None
+
+    def _executor(self):
+        if self._ex is None:
+            self._ex = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           initializer=_lower_priority)
+        return self._ex
+
+    def submit(self, jobs):
+        """jobs: {key: (cfg, scn, alg, params, recorder)}; cached keys are skipped."""
+        self.cancel()
+        ex = self._executor()
+        for key, args in jobs.items():
+            if key not in self._cache:
+                self._pending[key] = ex.submit(_precompute_worker, *args)
+
+    def cancel(self):
+        for fut in self._pending.values():
+            fut.cancel()
+        self._pending = {}
+
+    def clear(self):
+        """Cancel pending jobs and drop every cached result."""
+        self.cancel()
+        self._cache.clear()
+        self._sizes.clear()
+
+    @property
+    def busy(self):
+        return bool(self._pending)
+
+    def poll(self):
+        """Collect finished jobs; returns their keys."""
+        done = [k for k, f in self._pending.items() if f.done()]
+        for key in done:
+            fut = self._pending.pop(key)
+            if not fut.cancelled():
+                self._store(key, _result(fut))
+        return done
+
+    def get(self, key, wait=True):
+        """Cached result for `key`, or None.
+
+        With wait=True a job that is already running is waited for (it is
+        ahead of a fresh run); one still queued is cancelled instead.
+        """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        fut = self._pending.get(key)
+        if fut is None or not wait:
+            return None
+        if fut.cancel():
+            del self._pending[key]
+            return None
+        del self._pending[key]
+        return self._store(key, _result(fut))
+
+    def _store(self, key, res):
+        """Cache `res` (if it fits on its own) and return it."""
+        size = _nbytes(res)
+        if size > self.cache_bytes:
+            return res
+        self._cache[key] = res
+        self._sizes[key] = size
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size or sum(self._sizes.values()) > self.cache_bytes:
+            old, _ = self._cache.popitem(last=False)
+            del self._sizes[old]
+        return res
+
+    def shutdown(self):
+        self.cancel()
+        if self._ex is not None:
+            self._ex.shutdown(wait=False, cancel_futures=True)
+            self._ex = None
@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class SummaryPyramid:
+    """Min/max/mean level-of-detail pyramid over a uniformly sampled trace.
+
+    Level j summarises buckets of 2**j samples (level 0 is the trace
+    itself), so any view range can be answered from the coarsest level
+    that still has at least one bucket per requested point. Min/max are
+    exact over every bucket; the mean is kept as a bucket sum.
+    """
+
+    def __init__(self, v, t0=0.0, dt=1.0):
+        self.v = np.asarray(v, dtype=float)
+        self.t0 = float(t0)
+        self.dt = float(dt)
+        self.n = len(self.v)
+
+        # levels[j - 1] = (lo, hi, sum) for bucket size 2**j
+        self.levels = []
+        lo = hi = sm = self.v
+        while len(lo) > 1:
+            starts = np.arange(0, len(lo), 2)
+            lo = np.minimum.reduceat(lo, starts)
+            hi = np.maximum.reduceat(hi, starts)
+            sm = np.add.reduceat(sm, starts)
+            self.levels.append((lo, hi, sm))
+
+    def index_range(self, t_lo, t_hi):
+        i0 = int(np.floor((t_lo - self.t0) / self.dt))
+        i1 = int(np.ceil((t_hi - self.t0) / self.dt)) + 1
+        return max(0, i0), min(self.n, i1)
+
+    def level_for(self, i0, i1, npts):
+        j = 0
+        npts = max(1, int(npts))
+        while (i1 - i0) >> j > npts and j < len(self.levels):
+            j += 1
+        return j
+
+    def query(self, t_lo, t_hi, npts):
+        """Summaries covering [t_lo, t_hi] with at most ~npts buckets.
+
+        Returns (t, lo, hi, mean); t is the bucket centre. At level 0 lo, hi
+        and mean are all the raw samples.
+        """
+        i0, i1 = self.index_range(t_lo, t_hi)
+        if i1 <= i0:
+            empty = np.zeros(0)
+            return empty, empty, empty, empty
+
+        j = self.level_for(i0, i1, npts)
+        if j == 0:
+            v = self.v[i0:i1]
+            return self.t0 + np.arange(i0, i1) * self.dt, v, v, v
+
+        size = 1 << j
+        b0, b1 = i0 >> j, ((i1 - 1) >> j) + 1
+        lo, hi, sm = (a[b0:b1] for a in self.levels[j - 1])
+        starts = np.arange(b0, b1) * size
+        counts = np.minimum(starts + size, self.n) - starts
+        t = self.t0 + (starts + 0.5 * (counts - 1)) * self.dt
+        return t, lo, hi, sm / counts
+
+    def envelope(self, t_lo, t_hi, npts):
+        """Line vertices (x, y) tracing the exact min/max envelope."""
+        t, lo, hi, _ = self.query(t_lo, t_hi, npts)
+        i0, i1 = self.index_range(t_lo, t_hi)
+        if self.level_for(i0, i1, npts) == 0:
+            return t, lo
+        return np.repeat(t, 2), np.column_stack([lo, hi]).ravel()
+
+
+def minmax_envelope(t, v, npts):
+    """Single-level min/max decimation of a short, changing window.
+
+    Cheaper than building a SummaryPyramid when the data is redrawn once
+    and then replaced (live plots).
+    """
+    v = np.asarray(v, dtype=float)
+    n = len(v)
+    step = n // max(1, int(npts))
+    if step < 2:
+        return t, v
+    m = (n // step) * step
+    vb = v[:m].reshape(-1, step)
+    tb = t[:m].reshape(-1, step)[:, step // 2]
+    return np.repeat(tb, 2), np.column_stack([vb.min(axis=1), vb.max(axis=1)]).ravel()
@@ -28,7 +28,7 @@ def safe_log10_of_square(a):
 
 def is_diverged(*arrays):
     for arr in arrays:
-        if arr is None:
+        if arr is None or np.size(arr) == 0:
             continue
         a = np.asarray(arr, dtype=float)
         if not np.all(np.isfinite(a)):
@@ -0,0 +1,209 @@
+import os
+from collections import deque
+from itertools import count
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.signal import firwin
+
+# random numbers come in fixed blocks with their own RNG stream, so any
+# sample range can be generated on its own, in any order or process
+RNG_BLOCK = 16384
+
+# stream ids for SeedSequence spawn keys
+_WHITE, _IMPULSE, _PLANT = 0, 1, 2
+
+SCENARIO_DEFAULTS = dict(
+    fs=2000.0, T=0.8, seed=0,
+    # clean signal: "sine", "chirp" or "multitone"
+    signal="sine", f0=100.0, amp=1.0,
+    f1=500.0, sweep=1.0,                     # chirp f0 -> f1 every `sweep` s
+    tones=(100.0, 230.0, 370.0),             # multitone frequencies [Hz]
+    # noise: "gaussian", "colored" or "impulsive"
+    noise="gaussian", noise_mean=0.0, noise_std=0.1,
+    color_cutoff=0.1, color_taps=63,         # FIR lowpass, cutoff rel. to Nyquist
+    impulse_prob=1e-3, impulse_amp=20.0,     # impulses in units of noise_std
+    # ANC: x = noise source, d = s + plant * noise
+    anc=False, plant_len=64, plant_decay=0.1,
+    plant_period=0.0,                        # >0: plant morphs h0 -> h1 -> h0 [s]
+)
+
+
+def scenario_spec(scn=None, **overrides):
+    spec = dict(SCENARIO_DEFAULTS)
+    spec.update(scn or {})
+    spec.update(overrides)
+    return spec
+
+
+def scenario_length(scn):
+    """Number of samples, or None for an endless scenario (T=None)."""
+    spec = scenario_spec(scn)
+    if spec["T"] is None:
+        return None
+    # same length as np.arange(0.0, T, 1.0 / fs)
+    return max(0, int(np.ceil(spec["T"] / (1.0 / spec["fs"]))))
+
+
+def _rng(seed, stream, block):
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(stream, block)))
+
+
+def _white(spec, a, b):
+    """Unit-variance white noise for samples [a, b); zero before sample 0."""
+    out = np.zeros(b - a)
+    lo = max(a, 0)
+    if lo >= b:
+        return out
+    for blk in range(lo // RNG_BLOCK, (b - 1) // RNG_BLOCK + 1):
+        b0 = blk * RNG_BLOCK
+        z = _rng(spec["seed"], _WHITE, blk).standard_normal(RNG_BLOCK)
+        i0, i1 = max(lo, b0), min(b, b0 + RNG_BLOCK)
+        out[i0 - a:i1 - a] = z[i0 - b0:i1 - b0]
+    return out
+
+
+def _impulses(spec, a, b):
+    out = np.zeros(b - a)
+    lo = max(a, 0)
+    if lo >= b:
+        return out
+    for blk in range(lo // RNG_BLOCK, (b - 1) // RNG_BLOCK + 1):
+        b0 = blk * RNG_BLOCK
+        rng = _rng(spec["seed"], _IMPULSE, blk)
+        hit = rng.random(RNG_BLOCK) < spec["impulse_prob"]
+        z = np.where(hit, rng.standard_normal(RNG_BLOCK) * spec["impulse_amp"], 0.0)
+        i0, i1 = max(lo, b0), min(b, b0 + RNG_BLOCK)
+        out[i0 - a:i1 - a] = z[i0 - b0:i1 - b0]
+    return out
+
+
+def _color_fir(spec):
+    h = firwin(int(spec["color_taps"]), spec["color_cutoff"])
+    return h / np.sqrt(np.sum(h**2))
+
+
+def _noise(spec, a, b):
+    """Noise samples [a, b) with memory handled by regenerating history."""
+    if spec["noise"] == "colored":
+        h = _color_fir(spec)
+        w = _white(spec, a - len(h) + 1, b)
+        v = np.convolve(w, h, mode="valid")
+    elif spec["noise"] == "impulsive":
+        v = _white(spec, a, b) + _impulses(spec, a, b)
+    elif spec["noise"] == "gaussian":
+        v = _white(spec, a, b)
+    else:
+        raise ValueError(f"unknown noise type: {spec['noise']}")
+
+    v = spec["noise_mean"] + spec["noise_std"] * v
+    if a < 0:
+        v[:min(-a, len(v))] = 0.0
+    return v
+
+
+def _plants(spec):
+    L = max(1, int(spec["plant_len"]))
+    rng = np.random.default_rng(np.random.SeedSequence(spec["seed"], spawn_key=(_PLANT,)))
+    env = np.exp(-np.arange(L) * spec["plant_decay"])
+    h0 = rng.standard_normal(L) * env
+    h1 = rng.standard_normal(L) * env
+    h0 /= np.sqrt(np.sum(h0**2))
+    h1 /= np.sqrt(np.sum(h1**2))
+    return h0, h1
+
+
+def _clean(spec, t):
+    if spec["signal"] == "sine":
+        return spec["amp"] * np.sin(2 * np.pi * spec["f0"] * t)
+    if spec["signal"] == "chirp":
+        f0, f1, Ts = spec["f0"], spec["f1"], spec["sweep"]
+        tm = np.mod(t, Ts)
+        phase = 2 * np.pi * (f0 * tm + 0.5 * (f1 - f0) / Ts * tm**2)
+        return spec["amp"] * np.sin(phase)
+    if spec["signal"] == "multitone":
+        tones = np.atleast_1d(np.asarray(spec["tones"], float))
+        s = np.zeros_like(t)
+        for f in tones:
+            s += np.sin(2 * np.pi * f * t)
+        return spec["amp"] * s / max(1, len(tones))
+    raise ValueError(f"unknown signal type: {spec['signal']}")
+
+
+def generate_chunk(scn, start, stop):
+    """Samples [start, stop) of a scenario, shaped like make_signals' output.
+
+    Every sample depends only on the spec and its index, so concatenated
+    chunks are identical to one call over the whole range.
+    """
+    spec = scenario_spec(scn)
+    N = scenario_length(spec)
+    start, stop = max(0, int(start)), int(stop)
+    if N is not None:
+        stop = min(N, stop)
+    stop = max(start, stop)
+
+    t = np.arange(start, stop) * (1.0 / spec["fs"])
+    s_clean = _clean(spec, t)
+
+    if not spec["anc"]:
+        x = s_clean + _noise(spec, start, stop)
+        return t, s_clean, x
+
+    h0, h1 = _plants(spec)
+    L = len(h0)
+    v = _noise(spec, start - L + 1, stop)
+    p0 = np.convolve(v, h0, mode="valid")
+    if spec["plant_period"] > 0:
+        p1 = np.convolve(v, h1, mode="valid")
+        a = 0.5 * (1 - np.cos(2 * np.pi * t / spec["plant_period"]))
+        p0 = (1 - a) * p0 + a * p1
+    x_ref = v[L - 1:]
+    d_primary = s_clean + p0
+    return t, (d_primary, s_clean), x_ref
+
+
+def make_scenario(scn=None, **overrides):
+    spec = scenario_spec(scn, **overrides)
+    N = scenario_length(spec)
+    if N is None:
+        raise ValueError("endless scenario (T=None); use iter_scenario()")
+    return generate_chunk(spec, 0, N)
+
+
+def _chunk_starts(N, chunk):
+    # N is None for an endless scenario
+    return count(0, chunk) if N is None else iter(range(0, N, chunk))
+
+
+def iter_scenario(scn=None, chunk=65536, **overrides):
+    """Yield (start, t, s, x) chunk by chunk in constant memory; endless
+    for T=None."""
+    spec = scenario_spec(scn, **overrides)
+    for k0 in _chunk_starts(scenario_length(spec), chunk):
+        yield (k0,) + generate_chunk(spec, k0, k0 + chunk)
+
+
+def _chunk_worker(spec, k0, k1):
+    return (k0,) + generate_chunk(spec, k0, k1)
+
+
+def iter_scenario_parallel(scn=None, chunk=65536, max_workers=None, **overrides):
+    """Like iter_scenario, but upcoming chunks are generated in worker
+    processes; at most 2*max_workers chunks are in flight at a time."""
+    spec = scenario_spec(scn, **overrides)
+    starts = _chunk_starts(scenario_length(spec), chunk)
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        depth = 2 * workers
+        pending = deque()
+        for k0 in starts:
+            pending.append(ex.submit(_chunk_worker, spec, k0, k0 + chunk))
+            if len(pending) >= depth:
+                break
+        while pending:
+            res = pending.popleft().result()
+            k0 = next(starts, None)
+            if k0 is not None:
+                pending.append(ex.submit(_chunk_worker, spec, k0, k0 + chunk))
+            yield res
@@ -1,4 +1,5 @@
 import numpy as np
+from .scenarios import make_scenario
 
 def make_signals(fs=2000.0, f0=100.0, T=0.8,
                  noise_mean=0.0, noise_std=0.1,
@@ -20,6 +21,17 @@ def make_signals(fs=2000.0, f0=100.0, T=0.8,
     return t, (d_primary, s_clean), x_ref
 
 
+def make_inputs(cfg, scn=None):
+    """(t, s, x) for the main window's signal settings `cfg`; `scn` is a
+    scenario dict (see config.SCENARIOS) or None for make_signals."""
+    common = dict(fs=cfg["fs"], f0=cfg["f0"], T=cfg["T"],
+                  noise_mean=cfg["mean"], noise_std=cfg["std"],
+                  anc=cfg["anc"], seed=cfg["seed"])
+    if scn is not None:
+        return make_scenario(scn, **common)
+    return make_signals(**common)
+
+
 def hist_input(x, nt):
     N = len(x)
     if nt < 1 or nt > N:
@@ -0,0 +1,179 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin
+
+from .safety import clamp_array, is_diverged
+from .weight_history import WeightRecorder
+
+SUBBAND_ALGS = ("SAF-LMS", "SAF-NLMS")
+
+# hops d is held back so every band filter gets a few non-causal taps
+LOOKAHEAD = 4
+
+
+class DFTFilterBank:
+    """Streaming, 2x oversampled uniform DFT filter bank for real signals.
+
+    M bands, decimation D = M/2 and prototype length Lp = 16*M. The analysis
+    prototype has cutoff 1.5*pi/M, so it is flat across the band crossovers
+    and stops just short of the decimated band edge 2*pi/M. The synthesis
+    prototype is an M-th band filter (cutoff pi/M) lying inside that flat
+    region, which gives near-perfect reconstruction and hides the analysis
+    transition band, where the band filters adapt slowly, from the output.
+    Only bands 0..M/2 are kept, the others are their complex conjugates.
+    """
+
+    def __init__(self, bands=16):
+        M = int(bands)
+        if M < 2 or M % 2:
+            raise ValueError("bands must be an even number >= 2")
+        self.M = M
+        self.D = M // 2
+        self.Lp = 16 * M
+        self.nbins = M // 2 + 1
+        beta = 8.0
+        # odd-length (type I) prototypes padded to Lp so the synthesis filter
+        # is an exact M-th band filter
+        self.h = np.append(firwin(self.Lp - 1, 1.5 / M, window=("kaiser", beta)), 0.0)
+        self.g = np.append(firwin(self.Lp - 1, 1.0 / M, window=("kaiser", beta)), 0.0) * self.D
+        # modulate around the prototype centre so every band has the same
+        # phase and neighbouring bands add up coherently in the synthesis
+        c = (self.Lp - 2) // 2
+        self._rot = np.exp(-2j * np.pi * np.arange(self.nbins) * c / M)
+        # analysis + synthesis group delay minus the one-hop framing offset
+        self.delay = 2 * c - (self.D - 1)
+        self.reset()
+
+    def reset(self):
+        self._hist = np.zeros(self.Lp - 1)
+        self._tail = np.zeros((self.Lp // self.D - 1, self.D))
+
+    def analysis(self, x):
+        """Consume samples, return one row of subband samples per full hop."""
+        data = np.concatenate([self._hist, np.asarray(x, float)])
+        F = (len(data) - (self.Lp - 1)) // self.D
+        frames = sliding_window_view(data, self.Lp)[self.D - 1::self.D][:F]
+        self._hist = data[F * self.D:]
+
+        u = frames[:, ::-1] * self.h
+        u = u.reshape(F, self.Lp // self.M, self.M).sum(axis=1)
+        return np.conj(np.fft.rfft(u, axis=1)) * self._rot
+
+    def synthesis(self, S):
+        """Turn F rows of subband samples into F*D output samples."""
+        F = len(S)
+        c = np.fft.irfft(S * self._rot, n=self.M, axis=1) * self.M
+        c = np.tile(c, (1, self.Lp // self.M)) * self.g
+        c = c.reshape(F, self.Lp // self.D, self.D)
+
+        Q = self.Lp // self.D
+        acc = np.zeros((F + Q - 1, self.D))
+        acc[:Q - 1] = self._tail
+        for q in range(Q):
+            acc[q:q + F] += c[:, q]
+        self._tail = acc[F:].copy()
+        return acc[:F].ravel()
+
+
+class SubbandFilter:
+    """Subband adaptive filter: one decimated complex (N)LMS filter per band.
+
+    `nt` is the equivalent full-band filter length; every band runs
+    ceil(nt / D) + 2 + LOOKAHEAD taps at 1/D of the sample rate, so the work
+    per input sample is about 2*nt/D complex MACs instead of nt. A full-band
+    delay that is not a multiple of D becomes a two-sided fractional delay
+    in the bands, so d is held back LOOKAHEAD hops (LOOKAHEAD*D samples of
+    extra latency); without it the band models stall around -50 dB. State is
+    kept between process() calls so the signal can be fed block by block.
+    """
+
+    def __init__(self, nt, mu=0.5, eps=1e-3, bands=16, normalized=True):
+        self.fb_x = DFTFilterBank(bands)
+        self.fb_d = DFTFilterBank(bands)
+        self.fb_y = DFTFilterBank(bands)
+        self.fb_e = DFTFilterBank(bands)
+        self.mu = float(mu)
+        self.eps = float(eps)
+        self.normalized = normalized
+
+        K = self.fb_x.nbins
+        self.Ls = int(np.ceil(nt / self.fb_x.D)) + 2 + LOOKAHEAD
+        self.w = np.zeros((K, self.Ls), dtype=complex)
+        self._xb = np.zeros((K, self.Ls), dtype=complex)
+        self._dq = np.zeros((LOOKAHEAD, K), dtype=complex)
+
+    @property
+    def delay(self):
+        return self.fb_x.delay + LOOKAHEAD * self.fb_x.D
+
+    def process(self, x, d, adapt=True):
+        """Filter a block; returns full-band (y, e) delayed by `self.delay`."""
+        Xs = self.fb_x.analysis(x)
+        Ds = np.concatenate([self._dq, self.fb_d.analysis(d)])
+        self._dq = Ds[len(Ds) - LOOKAHEAD:]
+        Ds = Ds[:len(Ds) - LOOKAHEAD]
+
+        Ys = np.zeros_like(Ds)
+        w, xb = self.w, self._xb
+        for m in range(len(Xs)):
+            xb[:, 1:] = xb[:, :-1]
+            xb[:, 0] = Xs[m]
+            yk = np.sum(w * xb, axis=1)
+            Ys[m] = yk
+            if adapt:
+                ek = Ds[m] - yk
+                if self.normalized:
+                    norm = self.eps + np.sum(np.abs(xb)**2, axis=1)
+                    w += (self.mu * ek / norm)[:, None] * np.conj(xb)
+                else:
+                    w += (self.mu * ek)[:, None] * np.conj(xb)
+
+        return self.fb_y.synthesis(Ys), self.fb_e.synthesis(Ds - Ys)
+
+
+def make_subband_filter(name, nt, params):
+    p = params
+    if name == "SAF-NLMS":
+        return SubbandFilter(nt, mu=p["mu"], eps=p["eps"], bands=p["bands"])
+    elif name == "SAF-LMS":
+        return SubbandFilter(nt, mu=p["mu"], bands=p["bands"], normalized=False)
+    raise ValueError("Unknown algorithm")
+
+
+def run_subband_filter(name, d, x, nt, params, recorder=None, chunk=4096):
+    """Run a subband engine over input `x` and desired `d` (same length).
+
+    Output is compensated for the filter-bank delay so y/e line up with d
+    like the padasip runner's. Only final weights are recorded (magnitudes
+    of the per-band coefficients, flattened band by band).
+    """
+    flt = make_subband_filter(name, nt, params)
+    if recorder is None:
+        recorder = WeightRecorder("final")
+
+    N = len(d)
+    x = np.asarray(x, float)
+    d = np.asarray(d, float)
+    ys, es = [], []
+    for k0 in range(0, N, chunk):
+        y_b, e_b = flt.process(x[k0:k0 + chunk], d[k0:k0 + chunk])
+        ys.append(y_b)
+        es.append(e_b)
+
+    # flush the filter banks without adapting on the padding
+    pad = np.zeros(flt.delay + flt.fb_x.D)
+    y_b, e_b = flt.process(pad, pad, adapt=False)
+    ys.append(y_b)
+    es.append(e_b)
+
+    y = np.concatenate(ys)[flt.delay:flt.delay + N]
+    e = np.concatenate(es)[flt.delay:flt.delay + N]
+    recorder.finish(np.abs(flt.w).ravel(), N)
+
+    y = clamp_array(y)
+    e = clamp_array(e)
+
+    if is_diverged(y, e):
+        raise RuntimeError("Adaptive filter diverged")
+
+    return y, e, recorder
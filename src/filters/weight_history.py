@@ -0,0 +1,95 @@
+import numpy as np
+
+WEIGHT_MODES = ("final", "every", "ring")
+
+
+class WeightRecorder:
+    """Collects weight snapshots from a run according to a recording policy.
+
+    mode:
+        "final" – keep only the weights after the last sample
+        "every" – keep every k-th snapshot (every=1 is the full history)
+        "ring"  – keep the last `size` snapshots (after decimation by `every`)
+    taps: optional list of tap indices to record (default: all taps)
+
+    Snapshot k holds the weights *before* the update at sample k, matching
+    padasip's w_history. After a run `idx` holds the sample indices and `w`
+    the matching snapshots (rows); `final` always holds the last weights.
+    """
+
+    def __init__(self, mode="final", every=1, size=1024, taps=None):
+        if mode not in WEIGHT_MODES:
+            raise ValueError(f"unknown weight recording mode: {mode}")
+        self.mode = mode
+        self.every = max(1, int(every))
+        self.size = max(1, int(size))
+        self.taps = None if taps is None else np.asarray(taps, dtype=int)
+        self.final = None
+        self.n = 0
+
+        self._idx = []
+        self._w = []
+        self._ring = None
+        self._ring_idx = None
+        self._count = 0
+
+    def _select(self, W):
+        return W if self.taps is None else W[:, self.taps]
+
+    def select(self, W, k0):
+        """The rows of block W (starting at sample k0) the policy records,
+        and their sample indices; nothing is stored."""
+        start = (-k0) % self.every
+        W = self._select(W[start::self.every])
+        return W, k0 + start + self.every * np.arange(len(W))
+
+    def push(self, W, k0):
+        """Add a block of snapshots W (K x nt) starting at sample index k0."""
+        if self.mode == "final" or len(W) == 0:
+            return
+
+        W, idx = self.select(W, k0)
+
+        if self.mode == "every":
+            self._w.append(np.array(W, dtype=float))
+            self._idx.append(idx)
+            return
+
+        # ring buffer: only the newest `size` rows of the block can survive
+        W, idx = W[-self.size:], idx[-self.size:]
+        if self._ring is None:
+            self._ring = np.zeros((self.size, W.shape[1]))
+            self._ring_idx = np.zeros(self.size, dtype=int)
+        pos = (self._count + np.arange(len(W))) % self.size
+        self._ring[pos] = W
+        self._ring_idx[pos] = idx
+        self._count += len(W)
+
+    def finish(self, w_final, n):
+        """Store the weights after the last of `n` processed samples."""
+        self.final = np.array(w_final, dtype=float)
+        self.n = int(n)
+
+    @property
+    def idx(self):
+        if self.mode == "final":
+            return np.array([self.n]) if self.final is not None else np.zeros(0, dtype=int)
+        if self.mode == "every":
+            return np.concatenate(self._idx) if self._idx else np.zeros(0, dtype=int)
+        return self._ordered(self._ring_idx) if self._ring is not None else np.zeros(0, dtype=int)
+
+    @property
+    def w(self):
+        if self.mode == "final":
+            if self.final is None:
+                return np.zeros((0, 0))
+            return self._select(self.final[None, :])
+        if self.mode == "every":
+            return np.concatenate(self._w) if self._w else np.zeros((0, 0))
+        return self._ordered(self._ring) if self._ring is not None else np.zeros((0, 0))
+
+    def _ordered(self, buf):
+        if self._count < self.size:
+            return buf[:self._count].copy()
+        return np.roll(buf, -(self._count % self.size), axis=0)
+
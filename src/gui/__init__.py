@@ -1,3 +1,3 @@
-from .canvases import MplCanvas, FftCanvas
+from .canvases import MplCanvas, FftCanvas, WeightCanvas, LodLines
 from .param_tuner import ParamTuner
 from .main_window import MainWin
@@ -15,3 +15,54 @@ class FftCanvas(FigureCanvas):
         fig = Figure(figsize=(width, height), dpi=dpi)
         self.ax = fig.add_subplot(1, 1, 1)
         super().__init__(fig)
+
+class WeightCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=9, height=4, dpi=100):
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.ax_w = fig.add_subplot(1, 2, 1)
+        self.ax_mis = fig.add_subplot(1, 2, 2)
+        super().__init__(fig)
+
+class OrderCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=9, height=4, dpi=100):
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.ax_mse = fig.add_subplot(1, 2, 1)
+        self.ax_n90 = fig.add_subplot(1, 2, 2)
+        super().__init__(fig)
+
+
+class LodLines:
+    """Draws traces from SummaryPyramids at screen resolution.
+
+    Lines are registered per axes; whenever the x-limits change (toolbar
+    zoom/pan, autoscale) each line is re-queried for the visible range, so
+    redraw cost depends on the axes width in pixels, not the trace length.
+    """
+
+    def __init__(self):
+        self._lines = {}
+
+    def clear(self):
+        # Axes.clear() also drops the xlim_changed callbacks
+        self._lines = {}
+
+    def plot(self, ax, pyr, *args, **kwargs):
+        if pyr.n == 0:
+            return ax.plot([], [], *args, **kwargs)[0]
+        t_end = pyr.t0 + (pyr.n - 1) * pyr.dt
+        x, y = pyr.envelope(pyr.t0, t_end, self._npts(ax))
+        line, = ax.plot(x, y, *args, **kwargs)
+        if ax not in self._lines:
+            self._lines[ax] = []
+            ax.callbacks.connect("xlim_changed", self._on_xlim)
+        self._lines[ax].append((line, pyr))
+        return line
+
+    def _npts(self, ax):
+        return max(64, int(ax.get_window_extent().width))
+
+    def _on_xlim(self, ax):
+        lo, hi = ax.get_xlim()
+        npts = self._npts(ax)
+        for line, pyr in self._lines.get(ax, ()):
+            line.set_data(*pyr.envelope(lo, hi, npts))
@@ -1,24 +1,50 @@
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QLabel, QComboBox, QDoubleSpinBox, QSpinBox,
+    QApplication, QMainWindow, QWidget, QLabel, QComboBox, QDoubleSpinBox, QSpinBox,
     QCheckBox, QPushButton, QGridLayout, QHBoxLayout, QVBoxLayout,
-    QTableWidget, QTableWidgetItem, QFileDialog, QMessageBox
+    QTableWidget, QTableWidgetItem, QFileDialog, QMessageBox, QLineEdit,
+    QTabWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
-from gui.canvases import MplCanvas, FftCanvas
+from gui.canvases import MplCanvas, FftCanvas, WeightCanvas, OrderCanvas, LodLines
 from gui.param_tuner import ParamTuner
 
-from filters.signal_generation import make_signals, hist_input
-from filters.metrics import compute_metrics, moving_avg
+from filters.signal_generation import make_inputs, hist_input
+from filters.metrics import compute_metrics, moving_avg, weight_misalignment_db
 from filters.fft_utils import fft_mag
-from filters.filter_runner import run_padasip_filter, enforce_runtime_stability
+from filters.filter_runner import run_filter, enforce_runtime_stability, max_taps, MAX_TAPS
+from filters.comparison import run_comparison
+from filters.weight_history import WeightRecorder
+from filters.subband import SUBBAND_ALGS
+from filters.lattice import LATTICE_ALGS, lattice_order_sweep
+from filters.precompute import PresetPrecomputer
+from filters.pyramid import SummaryPyramid, minmax_envelope
+from filters.export import FixedPoint, export_run
+from filters.live import LiveSession
 from filters.safety import clamp_array, is_diverged, safe_log10_of_square
 
-from src.config import PARAMS, LIMITS, PRESETS
+from src.config import PARAMS, LIMITS, PRESETS, SCENARIOS
 
+import time
 import numpy as np
 
+LEGACY_SCENARIO = "Sine + Gaussian (classic)"
+
+PRECOMPUTE_DELAY_MS = 300     # quiet time after an input change before speculating
+PRECOMPUTE_POLL_MS = 100
+
+LIVE_TICK_MS = 10
+LIVE_MAX_STEP = 0.05    # at most this many seconds of signal per tick
+
+WEIGHT_REC_MODES = [
+    ("Final only", "final"),
+    ("Every k-th", "every"),
+    ("Ring buffer (last M)", "ring"),
+    ("Full history", "full"),
+]
+
 
 class MainWin(QMainWindow):
     def __init__(self):
@@ -39,7 +65,7 @@ class MainWin(QMainWindow):
         r += 1
         grid.addWidget(QLabel("Taps (nt)"), r, 0)
         self.spin_nt = QSpinBox()
-        self.spin_nt.setRange(1, 512)
+        self.spin_nt.setRange(1, max_taps(self.cmb_alg.currentText()))
         self.spin_nt.setValue(32)
         grid.addWidget(self.spin_nt, r, 1)
 
@@ -85,15 +111,46 @@ class MainWin(QMainWindow):
         self.spin_seed.setValue(0)
         grid.addWidget(self.spin_seed, r, 1)
 
+        r += 1
+        grid.addWidget(QLabel("Scenario"), r, 0)
+        self.cmb_scn = QComboBox()
+        self.cmb_scn.addItems([LEGACY_SCENARIO] + list(SCENARIOS.keys()))
+        grid.addWidget(self.cmb_scn, r, 1)
+
         r += 1
         self.cb_anc = QCheckBox("ANC mode (Adaptive Noise Canceller)")
         grid.addWidget(self.cb_anc, r, 0, 1, 2)
 
+        r += 1
+        grid.addWidget(QLabel("Weights"), r, 0)
+        self.cmb_wrec = QComboBox()
+        for label, mode in WEIGHT_REC_MODES:
+            self.cmb_wrec.addItem(label, mode)
+        self.cmb_wrec.setCurrentIndex(1)
+        grid.addWidget(self.cmb_wrec, r, 1)
+
+        r += 1
+        grid.addWidget(QLabel("Every k / ring M"), r, 0)
+        self.spin_wrec = QSpinBox()
+        self.spin_wrec.setRange(1, 1000000)
+        self.spin_wrec.setValue(64)
+        grid.addWidget(self.spin_wrec, r, 1)
+
+        r += 1
+        grid.addWidget(QLabel("Record taps"), r, 0)
+        self.edit_wtaps = QLineEdit("all")
+        self.edit_wtaps.setToolTip("'all' or comma-separated tap indices, e.g. 0,1,5")
+        grid.addWidget(self.edit_wtaps, r, 1)
+
         r += 1
         grid.addWidget(QLabel("Preset"), r, 0)
         self.cmb_preset_main = QComboBox()
         grid.addWidget(self.cmb_preset_main, r, 1)
-        self._refresh_main_presets()
+
+        r += 1
+        self.lbl_preset = QLabel("")
+        self.lbl_preset.setStyleSheet("color: gray")
+        grid.addWidget(self.lbl_preset, r, 0, 1, 2)
 
         r += 1
         self.btn_apply_preset = QPushButton("Apply preset")
@@ -109,14 +166,52 @@ class MainWin(QMainWindow):
         self.btn_save = QPushButton("Save Figures…")
         grid.addWidget(self.btn_save, r, 1)
 
+        r += 1
+        self.btn_compare = QPushButton("Compare all algorithms")
+        grid.addWidget(self.btn_compare, r, 0, 1, 2)
+
+        r += 1
+        self.btn_orders = QPushButton("Sweep orders 1…nt (lattice)")
+        self.btn_orders.setToolTip("One least-squares lattice pass gives MSE_end and N90% for every tap count up to nt")
+        grid.addWidget(self.btn_orders, r, 0, 1, 2)
+
+        r += 1
+        self.btn_live = QPushButton("Live \u25b6")
+        self.btn_live.setCheckable(True)
+        self.btn_live.setToolTip("Stream the signal continuously; T sets the visible window")
+        grid.addWidget(self.btn_live, r, 0)
+        self.spin_fps = QSpinBox()
+        self.spin_fps.setRange(1, 60)
+        self.spin_fps.setValue(25)
+        self.spin_fps.setSuffix(" fps")
+        grid.addWidget(self.spin_fps, r, 1)
+
+        r += 1
+        grid.addWidget(QLabel("Vector format"), r, 0)
+        self.edit_qfmt = QLineEdit("Q1.15")
+        self.edit_qfmt.setToolTip("Fixed-point format Qm.n (m incl. sign bit), e.g. Q1.15, Q4.20, UQ0.16")
+        grid.addWidget(self.edit_qfmt, r, 1)
+
+        r += 1
+        self.btn_export = QPushButton("Export test vectors…")
+        grid.addWidget(self.btn_export, r, 0, 1, 2)
+
         right = QWidget()
         right_v = QVBoxLayout(right)
 
         self.canvas = MplCanvas(self, width=9, height=7)
+        self.lod = LodLines()
+        right_v.addWidget(NavigationToolbar(self.canvas, self))
         right_v.addWidget(self.canvas)
 
+        self.tabs = QTabWidget()
         self.fftcanvas = FftCanvas(self, width=9, height=4)
-        right_v.addWidget(self.fftcanvas)
+        self.tabs.addTab(self.fftcanvas, "FFT")
+        self.wcanvas = WeightCanvas(self, width=9, height=4)
+        self.tabs.addTab(self.wcanvas, "Weights")
+        self.ordcanvas = OrderCanvas(self, width=9, height=4)
+        self.tabs.addTab(self.ordcanvas, "Order sweep")
+        right_v.addWidget(self.tabs)
 
         # metrics table
         self.tbl = QTableWidget(1, 8)
@@ -138,9 +233,40 @@ class MainWin(QMainWindow):
         self.btn_tune.clicked.connect(self.open_tuner)
         self.cmb_alg.currentTextChanged.connect(self.on_alg_change)
         self.btn_apply_preset.clicked.connect(self.apply_preset_main)
+        self.btn_compare.clicked.connect(self.run_compare)
+        self.btn_orders.clicked.connect(self.run_order_sweep)
+        self.btn_export.clicked.connect(self.export_vectors)
+        self.btn_live.toggled.connect(self.toggle_live)
+
+        # speculative preset runs: restarted (debounced) whenever an input changes
+        self._pre = PresetPrecomputer()
+        self._pre_keys = {}
+        self._pre_delay = QTimer(self)
+        self._pre_delay.setSingleShot(True)
+        self._pre_delay.setInterval(PRECOMPUTE_DELAY_MS)
+        self._pre_delay.timeout.connect(self._start_precompute)
+        self._pre_poll = QTimer(self)
+        self._pre_poll.setInterval(PRECOMPUTE_POLL_MS)
+        self._pre_poll.timeout.connect(self._poll_precompute)
+
+        for w in (self.spin_nt, self.spin_fs, self.spin_f0, self.spin_T, self.spin_mean,
+                  self.spin_std, self.spin_seed, self.spin_wrec):
+            w.valueChanged.connect(self._inputs_changed)
+        self.cmb_scn.currentIndexChanged.connect(self._inputs_changed)
+        self.cmb_wrec.currentIndexChanged.connect(self._inputs_changed)
+        self.cb_anc.toggled.connect(self._inputs_changed)
+        self.edit_wtaps.editingFinished.connect(self._inputs_changed)
+        self.cmb_preset_main.currentIndexChanged.connect(self._show_preset_preview)
+
+        self._live = None
+        self._live_timer = QTimer(self)
+        self._live_timer.setInterval(LIVE_TICK_MS)
+        self._live_timer.timeout.connect(self._live_tick)
 
         self._last_state = None
+        self._refresh_main_presets()
         self.run_once()
+        self._inputs_changed()
 
     # GUI Actions
     def _refresh_main_presets(self):
@@ -148,42 +274,56 @@ class MainWin(QMainWindow):
         self.cmb_preset_main.clear()
         self.cmb_preset_main.addItems(list(PRESETS.get(alg, {"Default": {}}).keys()))
 
-    def on_alg_change(self, *_):
+    def on_alg_change(self, alg):
+        # long filters only for the subband engine; the spin box clamps nt
+        self.spin_nt.setMaximum(max_taps(alg))
         self._refresh_main_presets()
         self.run_once()
+        self._inputs_changed()
 
     def open_tuner(self):
         alg = self.cmb_alg.currentText()
         dlg = ParamTuner(self, alg, PARAMS, LIMITS, PRESETS)
         dlg.exec_()
 
+    def _preset_params(self, alg, preset_name):
+        preset = PRESETS.get(alg, {}).get(preset_name, {})
+        params = PARAMS[alg].copy()
+        for k, v in preset.items():
+            if k in params:
+                lo, hi = LIMITS[alg][k]
+                params[k] = float(np.clip(v, lo, hi))
+        return params
+
     def apply_preset_main(self):
         alg = self.cmb_alg.currentText()
         preset_name = self.cmb_preset_main.currentText()
-        preset = PRESETS.get(alg, {}).get(preset_name, {})
-        if not preset:
+        if not PRESETS.get(alg, {}).get(preset_name):
             return
-        for k, v in preset.items():
-            if k in PARAMS[alg]:
-                lo, hi = LIMITS[alg][k]
-                PARAMS[alg][k] = float(np.clip(v, lo, hi))
+        PARAMS[alg].update(self._preset_params(alg, preset_name))
+        # instant when the preset was precomputed in the background
         self.run_once()
+        self._show_preset_preview()
 
     # MAIN RUN FUNCTION
-    def run_once(self):
-        alg = self.cmb_alg.currentText()
-        nt = int(self.spin_nt.value())
-        fs = float(self.spin_fs.value())
-        f0 = float(self.spin_f0.value())
-        T = float(self.spin_T.value())
-        mean = float(self.spin_mean.value())
-        std = float(self.spin_std.value())
-        anc = bool(self.cb_anc.isChecked())
-        seed = int(self.spin_seed.value())
-
-        t, s, x = make_signals(fs=fs, f0=f0, T=T,
-                               noise_mean=mean, noise_std=std,
-                               anc=anc, seed=seed)
+    def _read_signal_settings(self):
+        return dict(
+            nt=int(self.spin_nt.value()),
+            fs=float(self.spin_fs.value()),
+            f0=float(self.spin_f0.value()),
+            T=float(self.spin_T.value()),
+            mean=float(self.spin_mean.value()),
+            std=float(self.spin_std.value()),
+            anc=bool(self.cb_anc.isChecked()),
+            seed=int(self.spin_seed.value()),
+            scenario=self.cmb_scn.currentText(),
+        )
+
+    def _prepare_inputs(self, taps_matrix=True):
+        cfg = self._read_signal_settings()
+        nt, anc = cfg["nt"], cfg["anc"]
+
+        t, s, x = make_inputs(cfg, SCENARIOS.get(cfg["scenario"]))
 
         L = len(t)
         if nt > L:
@@ -192,21 +332,28 @@ class MainWin(QMainWindow):
             nt = L
             self.spin_nt.setValue(nt)
 
+        # only the comparison needs the N x nt tap matrix up front
+        X = hist_input(x, nt) if taps_matrix else None
+
         # ANC mode
         if anc:
             d_full, s_clean = s
-            X = hist_input(x, nt)
             d = d_full[nt - 1:]
-            s_ref = s_clean[nt - 1:]
-            x_in = d_full[nt - 1:]
 
         # non-ANC
         else:
             s_clean = s
-            X = hist_input(x, nt)
             d = s_clean[nt - 1:]
-            s_ref = s_clean[nt - 1:]
-            x_in = x[nt - 1:]
+
+        return t, s, x, X, d, nt, cfg["fs"], anc
+
+    def run_once(self):
+        if self._live is not None:
+            self._live_retune()
+            return
+
+        alg = self.cmb_alg.currentText()
+        t, s, x, _, d, nt, fs, anc = self._prepare_inputs(taps_matrix=False)
 
         # prepare params with stability enforcement
         params = PARAMS.get(alg, {}).copy()
@@ -214,12 +361,19 @@ class MainWin(QMainWindow):
 
         print(f"[DEBUG] alg={alg}, nt={nt}, mu={params.get('mu')}, order={params.get('order', None)}")
 
-        try:
-            y, e, w = run_padasip_filter(alg, d, X, params)
-        except Exception as ex:
-            QMessageBox.warning(self, "Filter error",
-                                f"{alg} failed during run:\n{ex}\nParams: {params}")
-            return
+        # a speculative background run of exactly this setup may be ready
+        res = self._pre.get(self._run_key(alg, params))
+        if res is not None and "error" not in res:
+            y, e, rec, m = res["y"], res["e"], res["w"], res["metrics"]
+        else:
+            m = None
+            try:
+                rec = self._make_recorder(nt)
+                y, e, rec = run_filter(alg, d, x, nt, params, recorder=rec)
+            except Exception as ex:
+                QMessageBox.warning(self, "Filter error",
+                                    f"{alg} failed during run:\n{ex}\nParams: {params}")
+                return
 
         y = clamp_array(y)
         e = clamp_array(e)
@@ -231,35 +385,204 @@ class MainWin(QMainWindow):
 
         print(f"[DEBUG] max|y|={np.max(np.abs(y))}, max|e|={np.max(np.abs(e))}")
 
-        m = compute_metrics(s, x, y, e, nt, anc=anc)
+        if m is None:
+            m = compute_metrics(s, x, y, e, nt, anc=anc)
 
         try:
             self.redraw_main_plots(t, s, x, y, e, nt, f"{alg} {params}", anc)
             self.redraw_fft(t, s, x, y, nt, fs, f"{alg}", anc)
-            self.update_table(m)
+            self.redraw_weights(t, rec, nt, fs, f"{alg}")
+            self.update_table({alg: m})
             self._last_state = dict(
                 t=t, s=s, x=x, y=y, e=e, nt=nt, fs=fs, alg=alg,
-                anc=anc, w=w, params=params
+                anc=anc, w=rec, params=params,
+                settings=self._read_signal_settings()
             )
         except Exception as ex:
             QMessageBox.warning(self, "Plot error", f"Plotting failed:\n{ex}")
 
+    def _make_recorder(self, nt):
+        mode = self.cmb_wrec.currentData()
+        k = int(self.spin_wrec.value())
+
+        text = self.edit_wtaps.text().strip().lower()
+        taps = None
+        if text and text != "all":
+            try:
+                taps = sorted({int(v) for v in text.replace(";", ",").split(",") if v.strip()})
+            except ValueError:
+                raise ValueError(f"invalid tap list: {text!r}")
+            if not taps or taps[0] < 0 or taps[-1] >= nt:
+                raise ValueError(f"tap indices must be in 0..{nt - 1}")
+
+        if mode == "full":
+            return WeightRecorder("every", every=1, taps=taps)
+        if mode == "ring":
+            return WeightRecorder("ring", size=k, taps=taps)
+        return WeightRecorder(mode, every=k, taps=taps)
+
+    # COMPARISON RUN
+    def run_compare(self):
+        # the live ticks would redraw over the result
+        if self._live is not None:
+            self._stop_live()
+        if self.spin_nt.value() > MAX_TAPS:
+            QMessageBox.warning(self, "Parameter error",
+                                f"The comparison runs every algorithm; use nt <= {MAX_TAPS}.")
+            return
+        t, s, x, X, d, nt, fs, anc = self._prepare_inputs()
+
+        alg_params = {
+            alg: enforce_runtime_stability(alg, p.copy(), LIMITS)
+            for alg, p in PARAMS.items()
+        }
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            results, errors = run_comparison(d, X, alg_params)
+        except Exception as ex:
+            QMessageBox.warning(self, "Comparison error", f"Comparison failed:\n{ex}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if errors:
+            QMessageBox.warning(self, "Filter error",
+                                "\n".join(f"{a}: {msg}" for a, msg in errors.items()))
+        if not results:
+            return
+
+        metrics = {alg: compute_metrics(s, x, y, e, nt, anc=anc)
+                   for alg, (y, e) in results.items()}
+
+        try:
+            self.redraw_compare_plots(t, s, x, results, nt, anc)
+            self.redraw_compare_fft(t, s, x, results, nt, fs, anc)
+            self.update_table(metrics)
+        except Exception as ex:
+            QMessageBox.warning(self, "Plot error", f"Plotting failed:\n{ex}")
+
+    # SPECULATIVE PRESET RUNS
+    def _run_key(self, alg, params):
+        cfg = self._read_signal_settings()
+        rec = (self.cmb_wrec.currentData(), int(self.spin_wrec.value()),
+               self.edit_wtaps.text().strip().lower())
+        return (alg, tuple(sorted(params.items())), tuple(sorted(cfg.items())), rec)
+
+    def _inputs_changed(self, *_):
+        # anything in flight or cached was computed for the old inputs; the
+        # keys could only match again once every input is restored exactly
+        self._pre.clear()
+        self._pre_keys = {}
+        self._pre_delay.start()
+        self._show_preset_preview()
+
+    def _start_precompute(self):
+        if self._live is not None:
+            return
+        alg = self.cmb_alg.currentText()
+        cfg = self._read_signal_settings()
+        try:
+            rec = self._make_recorder(cfg["nt"])
+        except ValueError:
+            return
+
+        jobs = {}
+        self._pre_keys = {}
+        for name in PRESETS.get(alg, {}):
+            params = enforce_runtime_stability(alg, self._preset_params(alg, name), LIMITS)
+            key = self._run_key(alg, params)
+            self._pre_keys[name] = key
+            jobs[key] = (cfg, SCENARIOS.get(cfg["scenario"]), alg, params, rec)
+
+        try:
+            self._pre.submit(jobs)
+        except Exception as ex:
+            # e.g. no process pool on this platform; previews stay empty
+            self._pre_keys = {}
+            self._show_preset_preview()
+            self.lbl_preset.setText(f"preview unavailable: {ex}")
+            return
+        self._pre_poll.start()
+        self._show_preset_preview()
+
+    def _poll_precompute(self):
+        if self._pre.poll():
+            self._show_preset_preview()
+        if not self._pre.busy:
+            self._pre_poll.stop()
+
+    def _preset_summary(self, name):
+        key = self._pre_keys.get(name)
+        res = None if key is None else self._pre.get(key, wait=False)
+        if res is None:
+            pending = key is not None or self._pre_delay.isActive()
+            return "computing…" if pending else ""
+        if "error" in res:
+            return f"failed: {res['error']}"
+        m = res["metrics"]
+        return f"MSE_end {m['mse']:.3e}   ΔSNR {m['dsnr']:.2f} dB   N90% {m['n90']}"
+
+    def _show_preset_preview(self, *_):
+        # per-item tooltips in the drop-down, current item below the combo
+        for i in range(self.cmb_preset_main.count()):
+            text = self._preset_summary(self.cmb_preset_main.itemText(i))
+            self.cmb_preset_main.setItemData(i, text, Qt.ToolTipRole)
+        self.lbl_preset.setText(self._preset_summary(self.cmb_preset_main.currentText()))
+
+    def closeEvent(self, event):
+        self._live_timer.stop()
+        self._pre.shutdown()
+        super().closeEvent(event)
+
+    # ORDER SWEEP
+    def run_order_sweep(self):
+        if self._live is not None:
+            self._stop_live()
+        t, s, x, _, _, nt, fs, anc = self._prepare_inputs(taps_matrix=False)
+        d = s[0] if anc else s
+
+        params = enforce_runtime_stability("LSL", PARAMS["LSL"].copy(), LIMITS)
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            res = lattice_order_sweep(d, x, nt, params)
+        except Exception as ex:
+            QMessageBox.warning(self, "Filter error", f"Order sweep failed:\n{ex}\nParams: {params}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        try:
+            self.redraw_order_sweep(res, nt, fs, params)
+            self.tabs.setCurrentWidget(self.ordcanvas)
+        except Exception as ex:
+            QMessageBox.warning(self, "Plot error", f"Plotting failed:\n{ex}")
+
     # PLOTTING
+    def _trace(self, ax, t, v, *args, **kwargs):
+        # traces are drawn through a min/max/mean pyramid so zoom/pan only
+        # touches as many points as the axes is wide
+        dt = t[1] - t[0] if len(t) > 1 else 1.0
+        pyr = SummaryPyramid(v, t[0] if len(t) else 0.0, dt)
+        return self.lod.plot(ax, pyr, *args, **kwargs)
+
     def redraw_main_plots(self, t, s, x, y, e, nt, title, anc):
         c = self.canvas
 
         for ax in (c.ax1, c.ax2, c.ax3, c.ax4):
             ax.clear()
+        self.lod.clear()
 
         # Inputs
         if anc:
             d_full, s_clean = s
-            c.ax1.plot(t, d_full, label="d (primary)")
-            c.ax1.plot(t, x, label="x (ref)")
-            c.ax1.plot(t, s_clean, 'k--', label="s clean")
+            self._trace(c.ax1, t, d_full, label="d (primary)")
+            self._trace(c.ax1, t, x, label="x (ref)")
+            self._trace(c.ax1, t, s_clean, 'k--', label="s clean")
         else:
-            c.ax1.plot(t, x, label="x (noisy)")
-            c.ax1.plot(t, s, 'k--', label="s clean")
+            self._trace(c.ax1, t, x, label="x (noisy)")
+            self._trace(c.ax1, t, s, 'k--', label="s clean")
 
         c.ax1.set_title(f"{title} – Inputs")
         c.ax1.grid(True)
@@ -271,14 +594,14 @@ class MainWin(QMainWindow):
         else:
             s_ref = s[nt - 1:]
 
-        c.ax2.plot(t[nt - 1:], y, label="y (out)")
-        c.ax2.plot(t[nt - 1:], s_ref, 'k--', label="s ref")
+        self._trace(c.ax2, t[nt - 1:], y, label="y (out)")
+        self._trace(c.ax2, t[nt - 1:], s_ref, 'k--', label="s ref")
         c.ax2.set_title("Output vs reference")
         c.ax2.grid(True)
         c.ax2.legend()
 
         # Error
-        c.ax3.plot(t[nt - 1:], e, label="e")
+        self._trace(c.ax3, t[nt - 1:], e, label="e")
         c.ax3.set_title("Error")
         c.ax3.grid(True)
         c.ax3.legend()
@@ -286,13 +609,114 @@ class MainWin(QMainWindow):
         # MSE (dB)
         mse_db = safe_log10_of_square(e)
         mse_db = moving_avg(mse_db, max(1, int(0.05 * len(mse_db))))
-        c.ax4.plot(t[nt - 1:], mse_db, label="MSE (dB)")
+        self._trace(c.ax4, t[nt - 1:], mse_db, label="MSE (dB)")
         c.ax4.set_title("MSE (dB)")
         c.ax4.grid(True)
         c.ax4.legend()
 
         c.draw()
 
+    def redraw_compare_plots(self, t, s, x, results, nt, anc):
+        c = self.canvas
+
+        for ax in (c.ax1, c.ax2, c.ax3, c.ax4):
+            ax.clear()
+        self.lod.clear()
+
+        if anc:
+            d_full, s_clean = s
+            self._trace(c.ax1, t, d_full, label="d (primary)")
+            self._trace(c.ax1, t, x, label="x (ref)")
+            self._trace(c.ax1, t, s_clean, 'k--', label="s clean")
+            s_ref = s_clean[nt - 1:]
+        else:
+            self._trace(c.ax1, t, x, label="x (noisy)")
+            self._trace(c.ax1, t, s, 'k--', label="s clean")
+            s_ref = s[nt - 1:]
+
+        c.ax1.set_title("Comparison – Inputs")
+        c.ax1.grid(True)
+        c.ax1.legend()
+
+        tt = t[nt - 1:]
+        for alg, (y, e) in results.items():
+            self._trace(c.ax2, tt, y, lw=0.8, label=alg)
+            self._trace(c.ax3, tt, e, lw=0.8, label=alg)
+            mse_db = safe_log10_of_square(e)
+            mse_db = moving_avg(mse_db, max(1, int(0.05 * len(mse_db))))
+            self._trace(c.ax4, tt, mse_db, lw=0.8, label=alg)
+        self._trace(c.ax2, tt, s_ref, 'k--', label="s ref")
+
+        c.ax2.set_title("Output vs reference")
+        c.ax3.set_title("Error")
+        c.ax4.set_title("MSE (dB)")
+        for ax in (c.ax2, c.ax3, c.ax4):
+            ax.grid(True)
+            ax.legend(fontsize="small")
+
+        c.draw()
+
+    # Weight trajectories / misalignment
+    def redraw_weights(self, t, rec, nt, fs, title):
+        c = self.wcanvas
+        c.ax_w.clear()
+        c.ax_mis.clear()
+
+        W, idx = rec.w, rec.idx
+        taps = rec.taps if rec.taps is not None else np.arange(W.shape[1] if W.ndim == 2 else 0)
+        tw = t[nt - 1] + idx / fs
+
+        if len(idx) > 1:
+            # keep the legend readable for wide filters
+            for j in range(min(W.shape[1], 8)):
+                c.ax_w.plot(tw, W[:, j], lw=0.8, label=f"w[{taps[j]}]")
+            if W.shape[1] > 8:
+                c.ax_w.plot(tw, W[:, 8:], lw=0.5, color="0.7")
+            w_ref = rec.final if rec.taps is None else rec.final[rec.taps]
+            c.ax_mis.plot(tw, weight_misalignment_db(W, w_ref), label="vs final w")
+            c.ax_w.legend(fontsize="small")
+            c.ax_mis.legend()
+        elif rec.final is not None:
+            w_last = W[-1] if len(W) else rec.final
+            c.ax_w.stem(taps if len(W) else np.arange(len(w_last)), w_last)
+            c.ax_w.set_xlabel("Tap")
+            c.ax_mis.text(0.5, 0.5, "No trajectory recorded",
+                          ha="center", va="center", transform=c.ax_mis.transAxes)
+
+        c.ax_w.set_title(f"{title} – Weights")
+        c.ax_w.grid(True)
+        c.ax_mis.set_title("Misalignment (dB)")
+        c.ax_mis.grid(True)
+
+        c.draw()
+
+    # MSE_end / N90% versus filter order
+    def redraw_order_sweep(self, res, nt, fs, params):
+        c = self.ordcanvas
+        c.ax_mse.clear()
+        c.ax_n90.clear()
+
+        order = res["order"]
+        mse_db = 10 * np.log10(res["mse"])
+        best = int(order[np.argmin(mse_db)])
+
+        c.ax_mse.plot(order, mse_db, marker=".", lw=0.8)
+        c.ax_mse.axvline(best, color="k", ls="--", lw=0.8, label=f"min at nt={best}")
+        c.ax_mse.set_title(f"LSL {params} – MSE_end (dB)", fontsize="small")
+        c.ax_mse.set_xlabel("Filter order (taps)")
+        c.ax_mse.legend()
+
+        c.ax_n90.plot(order, res["n90"] / fs * 1e3, marker=".", lw=0.8)
+        c.ax_n90.set_title("N90% convergence")
+        c.ax_n90.set_xlabel("Filter order (taps)")
+        c.ax_n90.set_ylabel("[ms]")
+
+        for ax in (c.ax_mse, c.ax_n90):
+            ax.set_xlim(0.5, nt + 0.5)
+            ax.grid(True)
+
+        c.draw()
+
     # FFT Plot
     def redraw_fft(self, t, s, x, y, nt, fs, title, anc):
         ax = self.fftcanvas.ax
@@ -326,16 +750,47 @@ class MainWin(QMainWindow):
 
         self.fftcanvas.draw()
 
+    def redraw_compare_fft(self, t, s, x, results, nt, fs, anc):
+        ax = self.fftcanvas.ax
+        ax.clear()
+
+        if anc:
+            d_full, s_clean = s
+            xin = d_full[nt - 1:]
+            sref = s_clean[nt - 1:]
+        else:
+            xin = x[nt - 1:]
+            sref = s[nt - 1:]
+
+        f1, Xin = fft_mag(clamp_array(xin), fs)
+        ax.semilogy(f1, Xin, color="0.6", label="Input")
+        for alg, (y, _) in results.items():
+            f2, Y = fft_mag(clamp_array(y), fs)
+            ax.semilogy(f2, Y, lw=0.8, label=alg)
+        f3, S = fft_mag(clamp_array(sref), fs)
+        ax.semilogy(f3, S, 'k--', label="Reference s")
+
+        ax.set_title("Comparison – FFT magnitude")
+        ax.set_xlabel("Frequency [Hz]")
+        ax.set_ylabel("|X(f)|")
+        ax.grid(True, which="both")
+        ax.legend(fontsize="small")
+
+        self.fftcanvas.draw()
+
     # Metrics Table
-    def update_table(self, m):
-        self.tbl.setItem(0, 0, QTableWidgetItem(f"{m['mse']:.4e}"))
-        self.tbl.setItem(0, 1, QTableWidgetItem(f"{m['emse']:.4e}"))
-        self.tbl.setItem(0, 2, QTableWidgetItem(f"{m['jmin']:.4e}"))
-        self.tbl.setItem(0, 3, QTableWidgetItem(f"{m['misadj']:.6f}"))
-        self.tbl.setItem(0, 4, QTableWidgetItem(f"{m['snr_in']:.2f}"))
-        self.tbl.setItem(0, 5, QTableWidgetItem(f"{m['snr_out']:.2f}"))
-        self.tbl.setItem(0, 6, QTableWidgetItem(f"{m['dsnr']:.2f}"))
-        self.tbl.setItem(0, 7, QTableWidgetItem(str(m['n90'])))
+    def update_table(self, rows):
+        self.tbl.setRowCount(len(rows))
+        self.tbl.setVerticalHeaderLabels(list(rows.keys()))
+        for r, m in enumerate(rows.values()):
+            self.tbl.setItem(r, 0, QTableWidgetItem(f"{m['mse']:.4e}"))
+            self.tbl.setItem(r, 1, QTableWidgetItem(f"{m['emse']:.4e}"))
+            self.tbl.setItem(r, 2, QTableWidgetItem(f"{m['jmin']:.4e}"))
+            self.tbl.setItem(r, 3, QTableWidgetItem(f"{m['misadj']:.6f}"))
+            self.tbl.setItem(r, 4, QTableWidgetItem(f"{m['snr_in']:.2f}"))
+            self.tbl.setItem(r, 5, QTableWidgetItem(f"{m['snr_out']:.2f}"))
+            self.tbl.setItem(r, 6, QTableWidgetItem(f"{m['dsnr']:.2f}"))
+            self.tbl.setItem(r, 7, QTableWidgetItem(str(m['n90'])))
         self.tbl.resizeColumnsToContents()
 
     # Saving Figures
@@ -357,3 +812,168 @@ class MainWin(QMainWindow):
         self.canvas.figure.savefig(fn, dpi=140)
         base = fn[:-4]
         self.fftcanvas.figure.savefig(base + "_FFT.png", dpi=140)
+        self.wcanvas.figure.savefig(base + "_W.png", dpi=140)
+        self.ordcanvas.figure.savefig(base + "_orders.png", dpi=140)
+
+    # HDL test vectors
+    def export_vectors(self):
+        if not self._last_state:
+            QMessageBox.information(self, "No data",
+                                    "Run simulation first.")
+            return
+
+        try:
+            fmt = FixedPoint.parse(self.edit_qfmt.text())
+        except ValueError as ex:
+            QMessageBox.warning(self, "Format error", str(ex))
+            return
+
+        out_dir = QFileDialog.getExistingDirectory(self, "Export test vectors to")
+        if not out_dir:
+            return
+
+        st = self._last_state
+        d = st["s"][0] if st["anc"] else st["s"]
+        params = dict(st["settings"], alg=st["alg"], filter=st["params"])
+        # subband/lattice engines record per-band magnitudes or ladder
+        # weights, not transversal taps a testbench could load
+        weights = None if st["alg"] in SUBBAND_ALGS + LATTICE_ALGS else st["w"]
+
+        try:
+            m = export_run(out_dir, st["x"], d, st["y"], st["e"], st["nt"],
+                           weights=weights, fmt=fmt, params=params)
+        except Exception as ex:
+            QMessageBox.warning(self, "Export error", f"Export failed:\n{ex}")
+            return
+
+        sat = {k: v["saturated"] for k, v in m["streams"].items() if v["saturated"]}
+        if sat:
+            QMessageBox.warning(self, "Saturation",
+                                f"Samples saturated in {fmt}:\n"
+                                + "\n".join(f"{k}: {n}" for k, n in sat.items()))
+
+    # LIVE MODE
+    def toggle_live(self, on):
+        if on:
+            self._start_live()
+        else:
+            self._stop_live()
+
+    def _start_live(self):
+        cfg = self._read_signal_settings()
+        alg = self.cmb_alg.currentText()
+        params = enforce_runtime_stability(alg, PARAMS.get(alg, {}).copy(), LIMITS)
+
+        scn = dict(SCENARIOS.get(cfg["scenario"], {}))
+        scn.update(fs=cfg["fs"], f0=cfg["f0"], noise_mean=cfg["mean"],
+                   noise_std=cfg["std"], anc=cfg["anc"], seed=cfg["seed"])
+        try:
+            self._live = LiveSession(alg, params, cfg["nt"], scn, window=cfg["T"])
+        except Exception as ex:
+            QMessageBox.warning(self, "Live error", f"Cannot start live mode:\n{ex}")
+            self.btn_live.setChecked(False)
+            return
+
+        # speculative runs would only compete with the live stream for CPU
+        self._pre.cancel()
+        self._setup_live_plots(alg, cfg["anc"])
+        self.btn_live.setText("Live \u25a0")
+        self._live_t0 = time.perf_counter()
+        self._live_last_draw = 0.0
+        self._live_timer.start()
+
+    def _stop_live(self):
+        self._live_timer.stop()
+        self._live = None
+        self.btn_live.blockSignals(True)
+        self.btn_live.setChecked(False)
+        self.btn_live.blockSignals(False)
+        self.btn_live.setText("Live \u25b6")
+        self._pre_delay.start()
+
+    def _live_retune(self):
+        alg = self.cmb_alg.currentText()
+        if alg != self._live.alg:
+            # a different algorithm needs a fresh filter
+            self._stop_live()
+            self.btn_live.setChecked(True)
+            return
+        params = enforce_runtime_stability(alg, PARAMS.get(alg, {}).copy(), LIMITS)
+        self._live.set_params(params)
+        self.canvas.ax1.set_title(f"{alg} {params} – live")
+
+    def _setup_live_plots(self, alg, anc):
+        c = self.canvas
+        for ax in (c.ax1, c.ax2, c.ax3, c.ax4):
+            ax.clear()
+            ax.grid(True)
+        self.lod.clear()
+
+        self._live_lines = dict(
+            x=c.ax1.plot([], [], label="x (ref)" if anc else "x (noisy)")[0],
+            s=c.ax1.plot([], [], 'k--', label="s clean")[0],
+            y=c.ax2.plot([], [], label="y (out)")[0],
+            sref=c.ax2.plot([], [], 'k--', label="s ref")[0],
+            e=c.ax3.plot([], [], label="e")[0],
+            mse=c.ax4.plot([], [], label="MSE (dB)")[0],
+        )
+        if anc:
+            self._live_lines["d"] = c.ax1.plot([], [], label="d (primary)")[0]
+
+        c.ax1.set_title(f"{alg} {self._live.params} – live")
+        c.ax2.set_title("Output vs reference")
+        c.ax3.set_title("Error")
+        c.ax4.set_title("MSE (dB)")
+        for ax in (c.ax1, c.ax2, c.ax3, c.ax4):
+            ax.legend(loc="upper left")
+        c.draw()
+
+    def _live_tick(self):
+        live = self._live
+        if live is None:
+            return
+
+        # keep pace with the wall clock, but bound the work per tick
+        now = time.perf_counter()
+        due = int((now - self._live_t0) * live.fs) - live.k
+        n = min(max(due, 0), int(LIVE_MAX_STEP * live.fs))
+        if n > 0:
+            try:
+                live.step(n)
+            except Exception as ex:
+                self._stop_live()
+                QMessageBox.warning(self, "Divergence detected",
+                                    f"Live filter stopped:\n{ex}")
+                return
+        if due > n:
+            # cannot keep up: drop the backlog instead of piling it up
+            self._live_t0 += (due - n) / live.fs
+
+        if now - self._live_last_draw >= 1.0 / self.spin_fps.value():
+            self._live_last_draw = now
+            self._draw_live()
+
+    def _draw_live(self):
+        W = self._live.window()
+        t = W["t"]
+        if len(t) < 2:
+            return
+
+        c = self.canvas
+        L = self._live_lines
+        npts = max(64, int(c.ax1.get_window_extent().width))
+        for key, src in (("x", "x"), ("d", "d"), ("s", "s"), ("y", "y"),
+                         ("sref", "s"), ("e", "e"), ("mse", "mse")):
+            if key in L:
+                L[key].set_data(*minmax_envelope(t, W[src], npts))
+
+        for ax in (c.ax1, c.ax2, c.ax3, c.ax4):
+            ax.set_xlim(t[0], t[-1])
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+        c.draw_idle()
+
+        anc = "d" in L
+        s = (W["d"], W["s"]) if anc else W["s"]
+        m = compute_metrics(s, W["x"], W["y"], W["e"], 1, anc=anc)
+        self.update_table({self._live.alg: m})
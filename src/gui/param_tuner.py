@@ -6,6 +6,8 @@ from PyQt5.QtCore import Qt
 import math
 import numpy as np
 
+INT_PARAMS = ("order", "bands")
+
 
 class ParamTuner(QDialog):
     def __init__(self, parent, alg_name: str, PARAMS, LIMITS, PRESETS):
@@ -50,7 +52,7 @@ class ParamTuner(QDialog):
             sld.setRange(0, 1000)
 
             # logarithmic slider for small ranges
-            use_log = lo > 0 and hi / lo >= 1e3 and key not in ("order",)
+            use_log = lo > 0 and hi / lo >= 1e3 and key not in INT_PARAMS
             log_cb = QCheckBox("log")
             log_cb.setChecked(use_log)
 
@@ -106,7 +108,7 @@ class ParamTuner(QDialog):
                 label=lab, spin=spn, slider=sld, log_cb=log_cb, lo=lo, hi=hi
             )
 
-        lay.addWidget(QLabel("Notes: NLMS μ<2. AP μ<1/order. RLS μ≈λ∈(0.9,1)."))
+        lay.addWidget(QLabel("Notes: NLMS μ<2. AP μ<1/order. RLS μ≈λ∈(0.9,1). SAF bands even."))
 
     # Preset Application
     def apply_preset(self):
@@ -122,7 +124,7 @@ class ParamTuner(QDialog):
             hi = self.ctrls[k]["hi"]
             v_clamped = float(np.clip(v, lo, hi))
 
-            self.PARAMS[self.alg][k] = int(v_clamped) if k == "order" else float(v_clamped)
+            self.PARAMS[self.alg][k] = int(v_clamped) if k in INT_PARAMS else float(v_clamped)
 
             spin = self.ctrls[k]["spin"]
             sl = self.ctrls[k]["slider"]
@@ -166,7 +168,7 @@ class ParamTuner(QDialog):
 
             return max(val, 1e-6)
 
-        if key == "order":
+        if key in INT_PARAMS:
             return max(1, int(round(val)))
 
         return val
@@ -178,7 +180,7 @@ class ParamTuner(QDialog):
         v = float(np.clip(val, lo, hi))
 
         # update PARAMS
-        if key == "order":
+        if key in INT_PARAMS:
             self.PARAMS[self.alg][key] = int(round(v))
         else:
             self.PARAMS[self.alg][key] = float(v)
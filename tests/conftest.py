@@ -0,0 +1,7 @@
+import os
+import sys
+
+# the app runs from src/ (imports "filters", "gui") with the repo root on the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
@@ -0,0 +1,27 @@
+import numpy as np
+from scipy.signal import lfilter
+
+from filters.comparison import run_comparison
+from filters.signal_generation import hist_input
+from filters.subband import run_subband_filter
+from src.config import PARAMS
+
+
+def test_comparison_runs_each_algorithm_on_shared_inputs():
+    rng = np.random.default_rng(0)
+    nt = 16
+    x = rng.standard_normal(6000)
+    d = lfilter(rng.standard_normal(nt), [1.0], x)[nt - 1:]
+    X = hist_input(x, nt)
+
+    algs = {a: PARAMS[a] for a in ("NLMS", "RLS", "SAF-NLMS", "LSL")}
+    algs["NLMS"] = dict(mu=50.0, eps=1e-3)        # diverges
+    results, errors = run_comparison(d, X, algs, max_workers=2)
+
+    assert set(results) == {"RLS", "SAF-NLMS", "LSL"} and set(errors) == {"NLMS"}
+    for y, e in results.values():
+        assert len(y) == len(e) == len(d)
+        assert np.mean(e[-1000:]**2) < 1e-3 * np.mean(d**2)
+    # workers see the same data as a direct run
+    y, e, _ = run_subband_filter("SAF-NLMS", d, x[nt - 1:], nt, PARAMS["SAF-NLMS"])
+    assert np.array_equal(results["SAF-NLMS"][0], y)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from filters.export import FixedPoint, export_chunked
+from filters.filter_runner import iter_filter_chunks
+from filters.scenarios import scenario_length
+from filters.weight_history import WeightRecorder
+from src.config import PARAMS
+
+
+def test_quantize_saturates():
+    fp = FixedPoint.parse("Q1.15")
+    q, nsat = fp.quantize([0.5, -1.0, 1.5, -1.5, np.nan])
+    assert q.tolist() == [16384, -32768, 32767, -32768, 0]
+    assert nsat == 2
+
+
+def test_quantize_64_bit_words():
+    fp = FixedPoint.parse("Q1.63")
+    q, nsat = fp.quantize([1.5, 1.0, -1.0, -1.5, 0.25])
+    assert q.tolist() == [fp.qmax, fp.qmax, fp.qmin, fp.qmin, 1 << 61]
+    assert nsat == 3                  # +1.0 is out of range, -1.0 is qmin
+    assert fp.to_hex(q[:1]) == b"7fffffffffffffff\n"
+
+    fp = FixedPoint.parse("UQ0.64")
+    q, nsat = fp.quantize([1.0, 0.5, -0.1])
+    assert q.tolist() == [(1 << 64) - 1, 1 << 63, 0]
+    assert nsat == 2
+    assert fp.to_hex(q) == b"ffffffffffffffff\n8000000000000000\n0000000000000000\n"
+
+
+def test_export_chunked_streams_weight_history(tmp_path):
+    scn = dict(signal="sine", T=0.5, fs=8000.0, seed=3)
+    nt, params = 8, dict(mu=0.5, eps=1e-3)
+
+    rec = WeightRecorder("every", every=100)
+    m = export_chunked(str(tmp_path), iter_filter_chunks("NLMS", scn, nt, params, chunk=1000,
+                                                         recorder=rec),
+                       nt, fmt="Q4.12", formats=("bin",), recorder=rec)
+    # nothing accumulated in the recorder; the file holds every 100th snapshot
+    assert len(rec.w) == 0
+    n_out = scenario_length(scn) - nt + 1
+    info = m["params"]["w_snapshots"]
+    assert info == dict(first=0, step=100, count=(n_out + 99) // 100)
+    W = np.fromfile(tmp_path / "w.bin", dtype="<i2").reshape(-1, nt)
+    assert len(W) == info["count"] == m["streams"]["w"]["samples"]
+
+
+def test_export_chunked_skips_non_tap_weights(tmp_path):
+    scn = dict(signal="sine", T=0.2, fs=8000.0, seed=3)
+    rec = WeightRecorder("final")
+    m = export_chunked(str(tmp_path), iter_filter_chunks("SAF-NLMS", scn, 32, PARAMS["SAF-NLMS"],
+                                                         recorder=rec),
+                       32, formats=("bin",), recorder=rec)
+    assert "w" not in m["streams"]
+    assert m["streams"]["y"]["samples"] == scenario_length(scn) - 31
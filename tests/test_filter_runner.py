@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from filters.filter_runner import (run_filter, iter_filter_chunks, make_filter, retune_filter,
+                                   MAX_TAPS)
+from filters.signal_generation import hist_input
+from filters.scenarios import make_scenario
+from filters.live import LiveSession
+from src.config import PARAMS
+
+
+def test_padasip_tap_count_is_capped():
+    x = np.random.default_rng(0).standard_normal(4 * MAX_TAPS)
+    nt = MAX_TAPS + 1
+    for alg in ("NLMS", "RLS", "GAL"):
+        with pytest.raises(ValueError):
+            run_filter(alg, x[nt - 1:], x, nt, PARAMS[alg])
+    with pytest.raises(ValueError):
+        LiveSession("RLS", PARAMS["RLS"], nt, None, window=1.0)
+
+
+def test_subband_takes_long_filters():
+    x = np.random.default_rng(0).standard_normal(8 * MAX_TAPS)
+    nt = 2 * MAX_TAPS
+    y, e, _ = run_filter("SAF-NLMS", x[nt - 1:], x, nt, PARAMS["SAF-NLMS"])
+    assert len(y) == len(e) == len(x) - nt + 1
+
+
+def test_chunked_run_matches_one_shot():
+    scn = dict(signal="sine", T=0.5, fs=8000.0, seed=3)
+    t, s, x = make_scenario(scn)
+    nt = 16
+    for alg in ("NLMS", "SAF-NLMS", "LSL"):
+        p = PARAMS[alg]
+        chunks = list(iter_filter_chunks(alg, scn, nt, p, chunk=700))
+        y = np.concatenate([c["y"] for c in chunks])
+        x_c = np.concatenate([c["x"] for c in chunks])
+        assert np.array_equal(x_c, x)
+        assert len(y) == len(x) - nt + 1
+        if alg == "NLMS":
+            continue                  # padasip starts from random weights
+        y1, _, _ = run_filter(alg, s[nt - 1:], x, nt, p)
+        assert np.allclose(y, y1)
+
+
+def test_retune_keeps_adaptive_state():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(2000)
+    X = hist_input(x, 8)
+    p = dict(PARAMS["GNGD"])
+    flt = make_filter("GNGD", 8, p)
+    flt.run(x[7:], X)
+    eps = flt.eps
+    assert eps != p["eps"]            # GNGD has adapted its regularisation
+
+    assert retune_filter(flt, "GNGD", dict(p), p) is flt
+    assert flt.eps == eps
+    retune_filter(flt, "GNGD", dict(p, mu=0.02), p)
+    assert flt.mu == 0.02 and flt.eps == eps
+
+    ap = make_filter("AP", 8, PARAMS["AP"])
+    assert retune_filter(ap, "AP", dict(PARAMS["AP"], mu=0.01), PARAMS["AP"]) is ap
+    assert retune_filter(ap, "AP", dict(PARAMS["AP"], order=2), PARAMS["AP"]) is not ap
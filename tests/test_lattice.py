@@ -0,0 +1,81 @@
+import numpy as np
+from scipy.signal import lfilter
+
+from filters.lattice import lattice_order_sweep
+from filters.signal_generation import hist_input
+from filters.filter_runner import run_padasip_filter
+
+N = 20000
+PARAMS = dict(mu=0.02, mu_k=0.01, beta=0.99, eps=1e-3)
+LSL = dict(mu=0.999, eps=1e-2)
+
+
+def _db(v):
+    return 10 * np.log10(v)
+
+
+def _fir_system(taps=8, seed=1):
+    rng = np.random.default_rng(seed)
+    x = lfilter([1.0], [1.0, -0.8], rng.standard_normal(N))
+    h = rng.standard_normal(taps)
+    h[-1] = 1.0                       # make the last tap matter
+    d = np.convolve(x, h)[:N] + 1e-3 * rng.standard_normal(N)
+    return x, d
+
+
+def _nlms_mse_db(x, d, nt):
+    _, e, _ = run_padasip_filter("NLMS", d[nt - 1:], hist_input(x, nt), dict(mu=0.5, eps=1e-3))
+    return _db(np.mean(e[-2000:]**2))
+
+
+def _ls_mse_db(x, d, nt):
+    X = hist_input(x, nt)
+    w = np.linalg.lstsq(X, d[nt - 1:], rcond=None)[0]
+    return _db(np.mean((d[nt - 1:] - X @ w)[-2000:]**2))
+
+
+def test_lsl_sweep_matches_separate_filters():
+    x, d = _fir_system(taps=8)
+    sweep = _db(lattice_order_sweep(d, x, 12, LSL)["mse"])
+    nlms = np.array([_nlms_mse_db(x, d, nt) for nt in range(1, 13)])
+    ls = np.array([_ls_mse_db(x, d, nt) for nt in range(1, 13)])
+
+    # every order is the least-squares filter of that length
+    assert np.all(np.abs(sweep - ls) < 0.5)
+    # and NLMS runs of the same length find the same knee and floor
+    assert np.argmax(-np.diff(nlms)) == np.argmax(-np.diff(sweep)) == 6
+    assert np.all(np.abs(sweep[7:] - nlms[7:]) < 3)
+
+
+def test_gal_sweep_matches_tap_count_sweep():
+    x, d = _fir_system(taps=8)
+    sweep = _db(lattice_order_sweep(d, x, 12, PARAMS, name="GAL")["mse"])
+    nlms = np.array([_nlms_mse_db(x, d, nt) for nt in range(1, 13)])
+
+    # both sweeps find the knee at the true length...
+    assert np.argmax(-np.diff(nlms)) == 6
+    assert np.argmax(-np.diff(sweep)) == 6
+    assert np.all(sweep[7:] < sweep[6] - 6)
+    assert np.all(sweep[7:] < _db(np.mean(d**2)) - 18)
+    # ...and agree where the filter is too short to model the system;
+    # beyond the knee the lattice sits on its own misadjustment floor
+    assert np.all(np.abs(sweep[3:7] - nlms[3:7]) < 3)
+
+
+def test_one_tap_delay_is_resolved_at_order_two():
+    rng = np.random.default_rng(2)
+    x = rng.standard_normal(N)
+    d = np.concatenate([[0.0], x[:-1]])
+    for name, p in (("GAL", PARAMS), ("LSL", LSL)):
+        mse = _db(lattice_order_sweep(d, x, 3, p, name=name)["mse"])
+        assert abs(mse[0]) < 0.5      # d is orthogonal to x(n): 0 dB is optimal
+        assert mse[1] < -20 and mse[2] < -20
+
+
+def test_sweep_never_worse_than_no_filter():
+    x, d = _fir_system(taps=8)
+    Pd = np.mean(d**2)
+    for p in (PARAMS, dict(mu=0.05, mu_k=0.02, beta=0.98, eps=1e-3),
+              dict(mu=0.1, mu_k=0.01, beta=0.99, eps=1e-3)):
+        # a 1-tap filter barely helps here; allow its misadjustment (<0.5 dB)
+        assert np.all(lattice_order_sweep(d, x, 32, p, name="GAL")["mse"] < 1.1 * Pd)
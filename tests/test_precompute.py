@@ -0,0 +1,48 @@
+from filters.precompute import PresetPrecomputer
+from filters.weight_history import WeightRecorder
+
+CFG = dict(fs=2000.0, f0=100.0, T=0.5, mean=0.0, std=0.1, anc=False, seed=0, nt=16)
+
+
+def _job(mu, rec=None):
+    return (CFG, None, "NLMS", dict(mu=mu, eps=1e-3), rec or WeightRecorder("final"))
+
+
+def test_cache_is_bounded_by_bytes():
+    # one run: y and e of 985 samples plus the 985 x 16 weight history,
+    # about 142 kB, so two fit
+    pre = PresetPrecomputer(max_workers=1, cache_bytes=300_000)
+    try:
+        pre.submit({mu: _job(mu, WeightRecorder("every")) for mu in (0.1, 0.2, 0.3)})
+        res = [pre.get(mu) for mu in (0.1, 0.2, 0.3)]
+        assert all("error" not in r for r in res)
+        assert list(pre._cache) == [0.2, 0.3]     # the oldest entry went
+        assert sum(pre._sizes.values()) <= pre.cache_bytes
+
+        pre.clear()
+        assert pre.get(0.3) is None
+    finally:
+        pre.shutdown()
+
+
+def test_get_waits_for_running_jobs_and_cancels_queued_ones():
+    # with one worker, job 0 runs (long enough to still be busy below)
+    # while the later ones sit in the queue
+    slow = dict(CFG, T=10.0)
+    jobs = {mu: _job(mu) for mu in (0.1, 0.2, 0.3, 0.4, 0.5)}
+    jobs[0.1] = (slow,) + jobs[0.1][1:]
+    pre = PresetPrecomputer(max_workers=1)
+    try:
+        pre.submit(jobs)
+        assert pre.busy
+        assert pre.get(0.5, wait=False) is None and 0.5 in pre._pending
+        assert pre.get(0.5) is None and 0.5 not in pre._pending   # queued: cancelled
+        r = pre.get(0.1)                                          # running: waited for
+        assert "error" not in r and len(r["y"]) == 20000 - 15
+
+        # a new batch cancels the old one and skips what is cached
+        pre.submit({mu: _job(mu) for mu in (0.1, 0.3)})
+        assert list(pre._pending) == [0.3]
+        assert pre.get(0.1, wait=False) is r
+    finally:
+        pre.shutdown()
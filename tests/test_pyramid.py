@@ -0,0 +1,26 @@
+import numpy as np
+
+from filters.pyramid import SummaryPyramid
+
+
+def test_query_min_max_is_exact_over_any_range():
+    rng = np.random.default_rng(0)
+    v = rng.standard_normal(10007)
+    v[4321] = 50.0                       # a lone spike must never be lost
+    pyr = SummaryPyramid(v, t0=1.0, dt=0.5)
+
+    for _ in range(50):
+        a, b = np.sort(rng.integers(0, len(v), 2))
+        npts = int(rng.integers(1, 400))
+        t, lo, hi, mean = pyr.query(1.0 + 0.5 * a, 1.0 + 0.5 * b, npts)
+
+        # buckets are aligned to their size and cover [a, b] exactly
+        j = pyr.level_for(*pyr.index_range(1.0 + 0.5 * a, 1.0 + 0.5 * b), npts)
+        size = 1 << j
+        starts = np.arange(a >> j, (b >> j) + 1) * size
+        assert len(t) == len(starts) and len(t) <= max(npts, 1) + 2
+        for k, s in enumerate(starts):
+            seg = v[s:s + size]
+            assert lo[k] == seg.min() and hi[k] == seg.max()
+            assert np.isclose(mean[k], seg.mean())
+        assert lo.min() <= v[a:b + 1].min() and hi.max() >= v[a:b + 1].max()
@@ -0,0 +1,42 @@
+from itertools import islice
+
+import numpy as np
+
+from filters.scenarios import RNG_BLOCK, make_scenario, iter_scenario, iter_scenario_parallel
+
+
+def test_endless_scenario_streams():
+    scn = dict(T=None, fs=1000.0)
+    for it in (iter_scenario(scn, chunk=700), iter_scenario_parallel(scn, chunk=700, max_workers=2)):
+        chunks = list(islice(it, 4))
+        it.close()
+        assert [c[0] for c in chunks] == [0, 700, 1400, 2100]
+        t = np.concatenate([c[1] for c in chunks])
+        assert np.allclose(t, np.arange(2800) / 1000.0)
+
+
+def _join(chunks):
+    chunks = list(chunks)
+    t = np.concatenate([c[1] for c in chunks])
+    x = np.concatenate([c[3] for c in chunks])
+    s = [c[2] for c in chunks]
+    s = tuple(np.concatenate(p) for p in zip(*s)) if isinstance(s[0], tuple) else np.concatenate(s)
+    return t, s, x
+
+
+def test_chunks_match_one_shot():
+    chunk = 5000
+    assert RNG_BLOCK % chunk             # chunks straddle the RNG blocks
+    base = dict(fs=8000.0, T=5.0, seed=7)
+    for scn in (dict(base, noise="gaussian"), dict(base, noise="colored"),
+                dict(base, noise="impulsive", impulse_prob=1e-2),
+                dict(base, anc=True, plant_period=2.0)):
+        t, s, x = make_scenario(scn)
+        for it in (iter_scenario(scn, chunk=chunk),
+                   iter_scenario_parallel(scn, chunk=chunk, max_workers=2)):
+            tc, sc, xc = _join(it)
+            assert np.array_equal(tc, t) and np.array_equal(xc, x)
+            if isinstance(s, tuple):
+                assert all(np.array_equal(a, b) for a, b in zip(sc, s))
+            else:
+                assert np.array_equal(sc, s)
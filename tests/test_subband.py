@@ -0,0 +1,49 @@
+import numpy as np
+from scipy.signal import lfilter
+
+from filters.subband import DFTFilterBank, run_subband_filter
+from filters.filter_runner import run_filter
+
+
+def _db(v):
+    return 10 * np.log10(v)
+
+
+def _echo_path(nt, N, rho=0.9, seed=0):
+    rng = np.random.default_rng(seed)
+    x = lfilter([1.0], [1.0, -rho], rng.standard_normal(N))
+    h = rng.standard_normal(nt) * np.exp(-np.arange(nt) / (nt / 4))
+    d = lfilter(h, [1.0], x) + 1e-4 * rng.standard_normal(N)
+    return x, d
+
+
+def _erle_db(e, d, k0, k1):
+    return _db(np.mean(e[k0:k1]**2) / np.mean(d**2))
+
+
+def test_filter_bank_reconstructs():
+    x = np.random.default_rng(0).standard_normal(8000)
+    for M in (4, 16, 64):
+        fb = DFTFilterBank(M)
+        z = fb.synthesis(fb.analysis(np.concatenate([x, np.zeros(fb.delay + M)])))
+        z = z[fb.delay:fb.delay + len(x)]
+        assert _db(np.mean((z - x)[1000:]**2)) < -60
+
+
+def test_cancellation_depth():
+    # colored input: with the analysis bands cut at the crossovers the
+    # error stalled between -30 and -35 dB here
+    for nt, bands, depth in ((256, 16, -42), (64, 16, -40), (256, 8, -42)):
+        x, d = _echo_path(nt, 40000)
+        _, e, _ = run_subband_filter("SAF-NLMS", d, x, nt, dict(mu=0.5, eps=1e-3, bands=bands))
+        assert _erle_db(e, d, 36000, 40000) < depth
+
+
+def test_faster_than_fullband_nlms_early_on():
+    nt, N = 256, 16000
+    x, d = _echo_path(nt, N)
+    params = dict(mu=0.5, eps=1e-3)
+    _, e_saf, _ = run_filter("SAF-NLMS", d[nt - 1:], x, nt, dict(params, bands=16))
+    _, e_nlms, _ = run_filter("NLMS", d[nt - 1:], x, nt, params)
+    k0, k1 = N - 4000 - nt, N - nt
+    assert _erle_db(e_saf, d, k0, k1) < _erle_db(e_nlms, d, k0, k1) - 10
@@ -0,0 +1,29 @@
+import numpy as np
+
+from filters.weight_history import WeightRecorder
+
+
+def _blocks(n, sizes, nt=3):
+    # snapshot k is k in every tap, so rows can be checked against idx
+    W = np.repeat(np.arange(n, dtype=float)[:, None], nt, axis=1)
+    k0 = 0
+    for m in sizes:
+        yield W[k0:k0 + m], k0
+        k0 += m
+
+
+def test_recorded_rows_match_their_sample_indices():
+    sizes = [7, 1, 0, 13, 5, 29, 2]
+    n = sum(sizes)
+
+    every = WeightRecorder("every", every=4, taps=[0, 2])
+    for W, k0 in _blocks(n, sizes):
+        every.push(W, k0)
+    assert np.array_equal(every.idx, np.arange(0, n, 4))
+    assert np.array_equal(every.w, np.repeat(every.idx[:, None], 2, axis=1))
+
+    ring = WeightRecorder("ring", every=3, size=5)
+    for W, k0 in _blocks(n, sizes):
+        ring.push(W, k0)
+    assert np.array_equal(ring.idx, np.arange(0, n, 3)[-5:])      # oldest first
+    assert np.array_equal(ring.w[:, 1], ring.idx)